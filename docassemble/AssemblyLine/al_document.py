@@ -1,7 +1,13 @@
 import re
 import os
+import shutil
 import mimetypes
-from typing import Any, Dict, List, Literal, Union, Callable, Optional
+import operator
+import string
+import tempfile
+import time
+import zipfile
+from typing import Any, Dict, Iterable, List, Literal, Union, Callable, Optional
 from docassemble.base.util import (
     Address,
     LatitudeLongitude,
@@ -30,10 +36,13 @@ from docassemble.base.util import (
     showifdef,
 )
 from docassemble.base.pdfa import pdf_to_pdfa
-from textwrap import wrap
+from textwrap import TextWrapper
+from functools import cached_property, lru_cache
+from contextlib import ExitStack
 from math import floor
 import subprocess
 from collections import ChainMap
+from itertools import accumulate, chain
 import pikepdf
 from typing import Tuple
 
@@ -56,7 +65,100 @@ __all__ = [
     "ALDocumentUpload",
 ]
 
-DEBUG_MODE = get_config("debug")
+# The server configuration does not change while this process is running, so we only
+# need to look each key up once
+_CONFIG_CACHE: Dict[str, Any] = {}
+
+
+def _config(key: str, default: Any = None) -> Any:
+    """
+    Return a value from the server configuration, looking it up only the first time.
+
+    Args:
+        key (str): The top-level configuration key
+        default (Any): The value to return if the key is not set
+
+    Returns:
+        Any: The configured value, or the default. Treat it as read-only, since it is shared.
+    """
+    if key not in _CONFIG_CACHE:
+        _CONFIG_CACHE[key] = get_config(key)
+    value = _CONFIG_CACHE[key]
+    return default if value is None else value
+
+
+DEBUG_MODE = _config("debug")
+
+# Documents are only ever requested with a handful of keys, like "final" and "preview"
+_space_to_underscore = lru_cache(maxsize=32)(space_to_underscore)
+
+
+@lru_cache(maxsize=32)
+def _pdf_cache_key(key: str, pdfa: bool = False) -> str:
+    """
+    Returns the name of the cache attribute that holds the PDF for a document key.
+    The PDF/A version of a document is a different file than the normal PDF, so
+    it gets its own name.
+
+    Args:
+        key (str): The document key, like "final" or "preview"
+        pdfa (bool): Whether the PDF is PDF/A compliant
+
+    Returns:
+        str: The name of the cache attribute.
+    """
+    safe_key = _space_to_underscore(key)
+    return safe_key + "-pdfa" if pdfa else safe_key
+
+
+@lru_cache(maxsize=64)
+def _extension_for_mimetype(mimetype: str) -> Optional[str]:
+    """
+    Returns the first file extension (like ".docx") that matches a mimetype.
+
+    Args:
+        mimetype (str): The mimetype to look up
+
+    Returns:
+        Optional[str]: The extension, including the leading dot, or None if there isn't one
+    """
+    return next(iter(mimetypes.guess_all_extensions(mimetype, strict=True)), None)
+
+
+def _is_docx_file(the_file: Any) -> bool:
+    """
+    Checks whether a file is a DOCX file, by its extension or its mimetype.
+
+    Args:
+        the_file (Any): The file to check, usually a DAFile
+
+    Returns:
+        bool: True if the file is a DOCX file, otherwise False
+    """
+    extension = getattr(the_file, "extension", None)
+    if extension and extension.lower() == "docx":
+        return True
+    return (
+        getattr(the_file, "mimetype", None)
+        == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    )
+
+
+# Used on every call to ALAddendumField.safe_value() and overflow_value()
+_NEWLINE_RE = re.compile(r"[\r\n]+|\r+|\n+")
+_WS_RE = re.compile(r"\s+")
+_MULTISPACE_RE = re.compile(r" {2,}")
+
+_DICT_TYPES = (dict, DADict)
+_LIST_TYPES = (list, DAList)
+_OBJ_CONTAINER_TYPES = (dict, DADict, DAObject)
+
+# Attributes of a DAObject that never make sense as addendum table columns
+_ATTR_IGNORE = frozenset({"has_nonrandom_instance_name", "instanceName", "attrList"})
+_DEFAULT_SKIP_ATTRIBUTES = frozenset({"complete"})
+
+# PDFs larger than this (in bytes) are memory-mapped when concatenated
+_MMAP_THRESHOLD = 10 * 1024 * 1024
 
 
 def base_name(filename: str) -> str:
@@ -69,6 +171,8 @@ def base_name(filename: str) -> str:
     Returns:
         str: The base name of the file without its extension.
     """
+    if "." not in filename:
+        return filename
     return os.path.splitext(filename)[0]
 
 
@@ -85,10 +189,7 @@ def label(dictionary: dict) -> str:
     Returns:
         str: The value of the first dictionary item or an empty string if not found.
     """
-    try:
-        return next(iter(dictionary.values()), "")
-    except:
-        return ""
+    return next(iter(dictionary.values()), "")
 
 
 def key(dictionary: dict) -> str:
@@ -104,10 +205,7 @@ def key(dictionary: dict) -> str:
     Returns:
         str: The key of the first dictionary item or an empty string if not found.
     """
-    try:
-        return next(iter(dictionary.keys()), "")
-    except:
-        return ""
+    return next(iter(dictionary.keys()), "")
 
 
 def safeattr(object: Any, key: str) -> str:
@@ -125,7 +223,7 @@ def safeattr(object: Any, key: str) -> str:
         The `location` attribute of an Address object or any LatitudeLongitude attribute of a DAObject is always skipped.
     """
     try:
-        if isinstance(object, dict) or isinstance(object, DADict):
+        if isinstance(object, _DICT_TYPES):
             return str(object.get(key, ""))
         elif isinstance(object, DAObject):
             # `location` is not an attribute people usually want shown in the table of people's attributes
@@ -143,17 +241,180 @@ def safeattr(object: Any, key: str) -> str:
         return ""
 
 
+def _attribute_as_str(object: Any, attribute: str) -> str:
+    """
+    Return an attribute of an object as a string, or an empty string if it can't be resolved.
+
+    Used for the cells of an addendum table, where we don't want to trigger collecting
+    attributes that are required to resolve to a string.
+
+    Args:
+        object (Any): The object to read the attribute from.
+        attribute (str): The name of the attribute.
+
+    Returns:
+        str: The attribute's value as a string, or an empty string.
+    """
+    try:
+        return str(getattr(object, attribute, ""))
+    except Exception:
+        return ""
+
+
+def _attributes_as_str(
+    getter: Optional[Callable[[Any], tuple]], object: Any, attributes: Tuple[str, ...]
+) -> List[str]:
+    """
+    Return several attributes of an object as strings, like calling `_attribute_as_str`
+    for each attribute.
+
+    Args:
+        getter (Optional[Callable[[Any], tuple]]): A getter made by `_attributes_getter`
+            for the same attributes, or None.
+        object (Any): The object to read the attributes from.
+        attributes (Tuple[str, ...]): The names of the attributes.
+
+    Returns:
+        List[str]: The attributes' values as strings; an empty string for any that can't be resolved.
+    """
+    if getter:
+        try:
+            return [str(value) for value in getter(object)]
+        except Exception:
+            # At least one attribute is missing or undefined: fall back to one at a time
+            pass
+    return [_attribute_as_str(object, attribute) for attribute in attributes]
+
+
+def _attributes_getter(attributes: Tuple[str, ...]) -> Optional[Callable[[Any], tuple]]:
+    """
+    Make a function that fetches all of the named attributes of an object in one call.
+
+    Returns None when `operator.attrgetter` would not behave like `getattr`, i.e. for names
+    that are not strings or that contain a dot (which `attrgetter` treats as a path).
+
+    Args:
+        attributes (Tuple[str, ...]): The names of the attributes.
+
+    Returns:
+        Optional[Callable[[Any], tuple]]: A function returning a tuple of the attributes' values, or None.
+    """
+    if not attributes or not all(
+        isinstance(attribute, str) and "." not in attribute for attribute in attributes
+    ):
+        return None
+    getter = operator.attrgetter(*attributes)
+    if len(attributes) == 1:
+        # attrgetter with a single name returns the value itself, not a tuple
+        return lambda object: (getter(object),)
+    return getter
+
+
+class _HtmlSafeTable(dict):
+    """
+    Translation table for `str.translate` that keeps ASCII letters and digits
+    and replaces every other character with an underscore.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        return "_"
+
+
+_HTML_SAFE_TABLE = _HtmlSafeTable(
+    {ord(char): char for char in string.ascii_letters + string.digits}
+)
+
+
+@lru_cache(maxsize=32)
+def _text_wrapper(
+    width: int,
+    max_lines: Optional[int] = None,
+    placeholder: str = " [...]",
+    replace_whitespace: bool = True,
+) -> TextWrapper:
+    """
+    Return a shared `TextWrapper` with the given options.
+
+    `textwrap.wrap` builds a new `TextWrapper` on every call. A `TextWrapper` keeps no
+    state between calls to its `wrap` method, so we can reuse one per set of options.
+    Only a few combinations of options are used in practice, so the cache stays small.
+
+    Args:
+        width (int): The maximum width of wrapped lines
+        max_lines (Optional[int]): Truncate the output to this many lines, if set
+        placeholder (str): Text to end truncated output with
+        replace_whitespace (bool): Whether to replace each whitespace character with a space
+
+    Returns:
+        TextWrapper: A wrapper configured with the given options
+    """
+    return TextWrapper(
+        width=width,
+        max_lines=max_lines,
+        placeholder=placeholder,
+        replace_whitespace=replace_whitespace,
+        drop_whitespace=True,
+    )
+
+
+def _first_wrapped_line(value: str, width: int) -> str:
+    """
+    Returns the first line that `textwrap.wrap` would produce for a string with
+    collapsed whitespace, without wrapping the rest of the string. A string that
+    already fits in `width` is returned whole, without trailing whitespace.
+
+    When the cut point is a plain space, we find it with `rfind`. Hyphenated
+    words, leading spaces and words longer than the width are broken by
+    `textwrap` in its own way, so those cases still use `textwrap.wrap`.
+
+    Args:
+        value (str): The string to wrap. Runs of whitespace must already be collapsed to one space.
+        width (int): The maximum width of the line
+
+    Returns:
+        str: The first line of the wrapped text, without trailing whitespace
+    """
+    if len(value) <= width:
+        return value.rstrip()
+    cut = value.rfind(" ", 0, width + 1)
+    if cut > 0 and not value.startswith(" ") and "-" not in value[: width + 1]:
+        next_space = value.find(" ", cut + 1)
+        if next_space == -1:
+            next_space = len(value)
+        if next_space - cut - 1 <= width:
+            return value[:cut].rstrip()
+    return next(iter(_text_wrapper(width).wrap(value))).rstrip()
+
+
 def html_safe_str(the_string: str) -> str:
     """
     Convert a string into a format that's safe for use as an HTML class or ID.
 
+    Each run of characters other than ASCII letters and digits is replaced with
+    a single underscore.
+
     Args:
         the_string (str): The string to be converted.
 
     Returns:
         str: A string that's safe for use as an HTML class or ID.
     """
-    return re.sub(r"[^A-Za-z0-9]+", "_", the_string)
+    if the_string.isascii() and the_string.isalnum():
+        return the_string
+    safe_string = the_string.translate(_HTML_SAFE_TABLE)
+    while "__" in safe_string:
+        safe_string = safe_string.replace("__", "_")
+    return safe_string
+
+
+_TABLE_ROW_TEMPLATE = (
+    '\n\t<div class="row al_doc_table_row">'
+    '\n\t\t<div class="col col-12 col-sm-6 al_doc_title">{title}</div>'
+    # At some widths, `col-6` barely has room to avoid
+    # wrapping lines for these buttons
+    '\n\t\t<div class="col col-12 col-sm-6 al_buttons">{buttons}</div>'
+    "\n\t</div>"
+)
 
 
 def table_row(title: str, button_htmls: List[str] = []) -> str:
@@ -167,19 +428,42 @@ def table_row(title: str, button_htmls: List[str] = []) -> str:
     Returns:
         str: An HTML string representing a row in an AL document-styled table.
     """
-    html = (
-        f'\n\t<div class="row al_doc_table_row">'
-        f'\n\t\t<div class="col col-12 col-sm-6 al_doc_title">{title}</div>'
-        # At some widths, `col-6` barely has room to avoid
-        # wrapping lines for these buttons
-        f'\n\t\t<div class="col col-12 col-sm-6 al_buttons">'
-    )
-    for button in button_htmls:
-        html += button
-    html += "</div>"
-    html += "\n\t</div>"
+    return _TABLE_ROW_TEMPLATE.format(title=title, buttons="".join(button_htmls))
+
+
+# Stands in for the URL when a button is rendered once and reused for many rows
+_BUTTON_URL_PLACEHOLDER = "__al_button_url__"
 
-    return html
+
+def _action_button_template(**kwargs) -> str:
+    """
+    Render an action button once, with a placeholder in place of the URL.
+
+    Rows in a document table share the same label, icon and styling and only differ
+    by URL, so the result can be reused with `_fill_button_template()` instead of
+    calling `action_button_html()` again for every row.
+
+    Args:
+        **kwargs: Keyword arguments to pass to `action_button_html()`
+
+    Returns:
+        str: HTML for the button, with a placeholder for the URL.
+    """
+    return action_button_html(_BUTTON_URL_PLACEHOLDER, **kwargs)
+
+
+def _fill_button_template(template: str, url: str) -> str:
+    """
+    Insert a URL into a button made by `_action_button_template()`.
+
+    Args:
+        template (str): HTML returned by `_action_button_template()`
+        url (str): The URL the button should point to
+
+    Returns:
+        str: HTML for the button.
+    """
+    return template.replace(_BUTTON_URL_PLACEHOLDER, url, 1)
 
 
 def pdf_page_parity(pdf_path: str) -> Literal["even", "odd"]:
@@ -194,11 +478,49 @@ def pdf_page_parity(pdf_path: str) -> Literal["even", "odd"]:
     Returns:
         Literal["even", "odd"]: The parity of the number of pages in the PDF
     """
-    with pikepdf.open(pdf_path) as pdf:
-        num_pages = len(pdf.pages)
-        if num_pages % 2 == 0:
-            return "even"
-        return "odd"
+    if _count_pdf_pages(pdf_path) % 2 == 0:
+        return "even"
+    return "odd"
+
+
+def _count_pdf_pages(pdf_path: str) -> int:
+    """
+    Count the pages in a PDF.
+
+    Most PDFs are well formed, so we first open the file without QPDF's repair pass
+    and only retry with recovery if that fails.
+
+    Args:
+        pdf_path (str): Path to the PDF in the filesystem
+
+    Returns:
+        int: The number of pages in the PDF
+    """
+    try:
+        with pikepdf.open(
+            pdf_path, attempt_recovery=False, suppress_warnings=True
+        ) as pdf:
+            return len(pdf.pages)
+    except pikepdf.PdfError:
+        with pikepdf.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+
+def _append_blank_page(pdf: pikepdf.Pdf) -> None:
+    """
+    Add a blank page the same size as the last page to the end of an open PDF.
+
+    Args:
+        pdf (pikepdf.Pdf): The PDF to modify
+    """
+    # Extract the size of the last page. `mediabox` also finds a MediaBox
+    # inherited from the page tree.
+    media_box = pdf.pages[-1].mediabox
+    width = float(media_box[2]) - float(media_box[0])
+    height = float(media_box[3]) - float(media_box[1])
+
+    # Add a blank page with the same dimensions as the last page
+    pdf.add_blank_page(page_size=(width, height))
 
 
 def add_blank_page(pdf_path: str) -> None:
@@ -210,20 +532,183 @@ def add_blank_page(pdf_path: str) -> None:
     """
     # Load the PDF
     with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
-        # Retrieve the last page
-        last_page = pdf.pages[-1]
+        _append_blank_page(pdf)
 
-        # Extract the size of the last page
-        media_box = last_page.MediaBox
+        # Overwrite the original PDF with the modified version
+        pdf.save(pdf_path)
 
-        # Create a new blank page with the same dimensions as the last page
-        blank_page = pikepdf.Page(pikepdf.Dictionary(MediaBox=media_box))
 
-        # Add the blank page to the end of the PDF
-        pdf.pages.append(blank_page)
+def ensure_pdf_page_parity(pdf_path: str, parity: Literal["even", "odd"]) -> bool:
+    """
+    Add a blank page to the end of a PDF if needed so that its number of pages
+    has the requested parity. Unlike calling `pdf_page_parity` and then `add_blank_page`,
+    this only opens the PDF once.
 
-        # Overwrite the original PDF with the modified version
+    Args:
+        pdf_path (str): Path to the PDF in the filesystem
+        parity (Literal["even", "odd"]): The parity the number of pages should have
+
+    Returns:
+        bool: True if a blank page was added, False if the PDF already had the requested parity
+    """
+    with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+        if ("even" if len(pdf.pages) % 2 == 0 else "odd") == parity:
+            return False
+        _append_blank_page(pdf)
         pdf.save(pdf_path)
+    return True
+
+
+def _concatenate_pdf_paths(
+    paths: List[str],
+    output_path: str,
+    ensure_parity: Optional[Literal["even", "odd"]] = None,
+) -> bool:
+    """
+    Copy the pages of several PDFs into a new PDF with pikepdf.
+
+    Copying pages leaves behind the document catalog, including the interactive
+    form (`/AcroForm`) and the bookmarks (`/Outlines`), so a PDF with form fields
+    or bookmarks would lose them. Nothing is saved if any of the PDFs has either.
+
+    Args:
+        paths (List[str]): Paths to the PDFs to concatenate, in order
+        output_path (str): Where to save the combined PDF
+        ensure_parity (Optional[Literal["even", "odd"]]): If given, add a blank page at the end
+            when needed so the number of pages is even or odd, before the PDF is saved
+
+    Returns:
+        bool: True if the combined PDF was saved, False if one of the PDFs has form
+            fields or bookmarks and should be combined with `pdf_concatenate` instead
+    """
+    # Copied pages read their content from the source PDFs until saved,
+    # so keep all of them open until then
+    with ExitStack() as stack, pikepdf.Pdf.new() as combined:
+        for path in paths:
+            # Memory-map large attachments instead of reading them into memory
+            if os.path.getsize(path) > _MMAP_THRESHOLD:
+                source = pikepdf.open(path, access_mode=pikepdf.AccessMode.mmap)
+            else:
+                source = pikepdf.open(path)
+            stack.enter_context(source)
+            if "/AcroForm" in source.Root or "/Outlines" in source.Root:
+                return False
+            combined.pages.extend(source.pages)
+        if ensure_parity:
+            parity = "even" if len(combined.pages) % 2 == 0 else "odd"
+            if parity != ensure_parity:
+                _append_blank_page(combined)
+        combined.save(
+            output_path,
+            compress_streams=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+    return True
+
+
+def _fast_concatenate(
+    files: List[Any],
+    filename: str,
+    ensure_parity: Optional[Literal["even", "odd"]] = None,
+) -> Optional[DAFile]:
+    """
+    Concatenate PDFs by copying their pages into a new PDF with pikepdf. Unlike
+    `pdf_concatenate`, this never converts or re-renders the input files.
+
+    Args:
+        files (List[Any]): The PDFs to concatenate, in order
+        filename (str): The filename of the combined PDF
+        ensure_parity (Optional[Literal["even", "odd"]]): If given, add a blank page at the end
+            when needed so the number of pages is even or odd, before the PDF is saved
+
+    Returns:
+        Optional[DAFile]: The combined PDF, or None if one of the files isn't a PDF,
+            has form fields or bookmarks, or couldn't be read, in which case use
+            `pdf_concatenate` instead
+    """
+    for the_file in files:
+        if not (
+            hasattr(the_file, "mimetype") and the_file.mimetype == "application/pdf"
+        ):
+            return None
+    paths = [the_file.path() for the_file in files]
+    combined_file = DAFile()
+    combined_file.set_random_instance_name()
+    combined_file.initialize(filename=filename, extension="pdf")
+    try:
+        if not _concatenate_pdf_paths(paths, combined_file.path(), ensure_parity):
+            return None
+    except pikepdf.PdfError as ex:
+        log(f"Could not concatenate PDFs with pikepdf, falling back: {ex}")
+        return None
+    combined_file.retrieve()
+    combined_file.commit()
+    return combined_file
+
+
+# Formats that are already compressed, so deflating them again only costs time
+_COMPRESSED_EXTENSIONS = frozenset(
+    {".pdf", ".docx", ".xlsx", ".pptx", ".zip", ".png", ".jpg", ".jpeg", ".gif"}
+)
+
+
+def _write_zip(entries: List[Tuple[str, str]], zip_path: str) -> None:
+    """
+    Write a zip file. Files that are already compressed, like PDFs and DOCX files,
+    are stored as-is instead of being deflated again.
+
+    Args:
+        entries (List[Tuple[str, str]]): The name in the zip file and the path on
+            disk of each file, in order
+        zip_path (str): Where to save the zip file
+    """
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(zip_path, mode="w") as zf:
+        for name, path in entries:
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            info.external_attr = 0o644 << 16
+            if os.path.splitext(name)[1].lower() in _COMPRESSED_EXTENSIONS:
+                info.compress_type = zipfile.ZIP_STORED
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+            # Copy in 1 MB chunks instead of reading whole files into memory
+            with open(path, "rb") as src, zf.open(info, "w") as dest:
+                shutil.copyfileobj(src, dest, 1024 * 1024)
+
+
+def _zip_documents(files: List[Any], filename: str) -> DAFile:
+    """
+    Make a zip file of a flat list of files. Files that are already compressed,
+    like PDFs and DOCX files, are stored as-is instead of being deflated again.
+
+    Falls back to docassemble's `zip_file` for anything other than a list of
+    single files with distinct names.
+
+    Args:
+        files (List[Any]): The files to put in the zip file
+        filename (str): The filename of the zip file
+
+    Returns:
+        DAFile: The zip file
+    """
+    if not all(
+        isinstance(the_file, DAFile) and hasattr(the_file, "filename")
+        for the_file in files
+    ):
+        return zip_file(files, filename=filename)
+    names = [str(the_file.filename) for the_file in files]
+    if len(set(names)) != len(names):
+        return zip_file(files, filename=filename)
+    the_zip = DAFile()
+    the_zip.set_random_instance_name()
+    the_zip.initialize(filename=filename, extension="zip")
+    _write_zip(
+        [(name, the_file.path()) for the_file, name in zip(files, names)],
+        the_zip.path(),
+    )
+    the_zip.retrieve()
+    the_zip.commit()
+    return the_zip
 
 
 class ALAddendumField(DAObject):
@@ -251,6 +736,73 @@ class ALAddendumField(DAObject):
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
 
+    def _page_cache(self) -> "DALazyAttribute":
+        """
+        Return this field's per-page cache, creating it on first use.
+
+        Many fields on a form never overflow or get rendered on a given page, so the
+        cache is not created in `init()`. That keeps an extra object per field out of
+        the saved interview answers until the field is actually used.
+
+        Returns:
+            DALazyAttribute: The cache, which is emptied on each page load.
+        """
+        if not hasattr(self, "_cache"):
+            self.initializeAttribute("_cache", DALazyAttribute)
+        return self._cache
+
+    def _render_cache(self) -> Dict[tuple, Any]:
+        """
+        Return a dictionary for remembering the text computed for this field on the current page.
+
+        Templates often ask for the safe value and the overflow value of the same field several
+        times with the same arguments. The dictionary lives on a DALazyAttribute, so it is
+        discarded on each page load.
+
+        Returns:
+            Dict[tuple, Any]: The cache, keyed by method name, arguments and the field's value.
+        """
+        cache = self._page_cache()
+        if not hasattr(cache, "rendered"):
+            cache.rendered = {}
+        return cache.rendered
+
+    def _resolved_value(self) -> Any:
+        """
+        Like `value_if_defined()`, but remembers a defined value for the rest of the page.
+
+        Each call to `value_if_defined()` asks docassemble to look the variable up by name,
+        and a template typically asks for the same field's value several times. An empty
+        string is not remembered, because the field might not be defined yet.
+
+        Returns:
+            Any: The value of the field if it exists, otherwise an empty string.
+        """
+        cache = self._page_cache()
+        if hasattr(cache, "resolved_value"):
+            return cache.resolved_value
+        value = self.value_if_defined()
+        if not (isinstance(value, str) and value == ""):
+            cache.resolved_value = value
+        return value
+
+    def _is_defined(self) -> bool:
+        """
+        Check whether the field's variable is defined, remembering a positive answer for
+        the rest of the page. A negative answer is checked again each time, since the
+        variable might be defined later in the page.
+
+        Returns:
+            bool: True if the variable named by `field_name` is defined.
+        """
+        cache = self._page_cache()
+        if hasattr(cache, "is_defined") or hasattr(cache, "resolved_value"):
+            return True
+        if defined(self.field_name):
+            cache.is_defined = True
+            return True
+        return False
+
     def overflow_value(
         self,
         preserve_newlines: bool = False,
@@ -289,7 +841,16 @@ class ALAddendumField(DAObject):
             return ""
 
         # If trigger is not a boolean value, overflow value is the value that starts at the end of the safe value.
-        original_value = self.value_if_defined()
+        original_value = self._resolved_value()
+        if isinstance(original_value, str):
+            return self._split_text(
+                original_value,
+                overflow_message=overflow_message,
+                input_width=input_width,
+                preserve_newlines=preserve_newlines,
+                preserve_words=preserve_words,
+            )[1]
+
         safe_text = self.safe_value(
             overflow_message=overflow_message,
             input_width=input_width,
@@ -297,33 +858,8 @@ class ALAddendumField(DAObject):
             _original_value=original_value,
             preserve_words=preserve_words,
         )
-        if isinstance(safe_text, str):
-            max_lines = self.max_lines(input_width=input_width)
-
-            if preserve_newlines and max_lines > 1:
-                # we do our own substitution of whitespace, only double newlines and spaces
-                value_to_process = (
-                    re.sub(r"[\r\n]+|\r+|\n+", r"\n", original_value).replace("  ", " ")
-                ).rstrip()
-            else:
-                # textwrap.wrap(replace_whitespace=True) replaces all whitespace, not just double newlines and spaces
-                value_to_process = re.sub(r"\s+", " ", original_value).strip()
-
-            if safe_text == value_to_process:  # no overflow
-                return ""
-            # If this is a string, the safe value will include an overflow message. Delete
-            # the overflow message from the length of the safe value to get the starting character.
-            # Note: if preserve newlines is False:
-            #   1. All single and double newlines are replaced with a space
-            #   2. Character count will adjust to reflect double-newlines being replaced with one char.
-            # If preserve newlines is True:
-            #   1. We replace all double newlines with \n.
-            #   2. Character count will adjust to reflect double-newlines being replaced with one char.
-            overflow_start = max(len(safe_text) - len(overflow_message), 0)
-            return value_to_process[overflow_start:].lstrip()
-
         # Do not subtract length of overflow message if this is a list of objects instead of a string
-        elif isinstance(safe_text, (list, DAList)):
+        if isinstance(safe_text, _LIST_TYPES):
             return original_value[self.overflow_trigger :]
         raise ValueError(
             f"Attempted ALAddendum overflow for {self.field_name } which is of type {type(safe_text)}. Overflow is for lists and strings only."
@@ -351,7 +887,7 @@ class ALAddendumField(DAObject):
         Returns:
             Any: The whole value of the field, irrespective of overflow.
         """
-        return self.value_if_defined()
+        return self._resolved_value()
 
     def has_overflow(
         self,
@@ -383,7 +919,18 @@ class ALAddendumField(DAObject):
         if _original_value:
             val = _original_value
         else:
-            val = self.value_if_defined()
+            val = self._resolved_value()
+
+        # Short values cannot overflow, so skip computing the safe value
+        if isinstance(val, str):
+            if (
+                len(val) <= self.overflow_trigger
+                and "\r" not in val
+                and "\n" not in val
+            ):
+                return False
+        elif isinstance(val, _LIST_TYPES) and len(val) <= self.overflow_trigger:
+            return False
 
         return (
             self.safe_value(
@@ -428,7 +975,7 @@ class ALAddendumField(DAObject):
         if _original_value:
             val = _original_value
         else:
-            val = self.value_if_defined()
+            val = self._resolved_value()
 
         if not self.has_overflow(
             overflow_message=overflow_message,
@@ -482,62 +1029,160 @@ class ALAddendumField(DAObject):
         if _original_value:
             value = _original_value
         else:
-            value = self.value_if_defined()
+            value = self._resolved_value()
+        overflow_trigger = self.overflow_trigger
         if (
             isinstance(value, str)
-            and len(value) <= self.overflow_trigger
+            and len(value) <= overflow_trigger
             and (value.count("\r") + value.count("\n")) == 0
         ):
             return value
 
-        max_lines = self.max_lines(input_width=input_width)
-        max_chars = max(
-            self.overflow_trigger - len(overflow_message), 1
-        )  # width needs to be at least 1 char
-
-        # Strip newlines from strings because they take extra space
         if isinstance(value, str):
-            # If we preserve newlines, we need to account for max_lines, not just max_chars
-            if preserve_newlines and max_lines > 1:
-                # Replace all new line characters with just \n. \r\n inserts two lines in a PDF
-                value = re.sub(r"[\r\n]+|\r+|\n+", r"\n", value).rstrip()
-                # textwrap.wrap does all the hard work for us here
-                return (
-                    " ".join(
-                        wrap(
-                            value,
-                            width=input_width,
-                            max_lines=max_lines,
-                            replace_whitespace=False,
-                            placeholder=overflow_message,
-                        )
-                    )
-                    .replace("  ", " ")
-                    .rstrip()
-                )
-
-            value = re.sub(r"\s+", " ", value)
-            if len(value) > self.overflow_trigger:
-                if preserve_words:
-                    retval = wrap(
-                        value,
-                        width=max_chars,
-                        replace_whitespace=True,
-                        drop_whitespace=True,
-                    )
-                    return next(iter(retval)).rstrip() + overflow_message
-                return value.rstrip()[:max_chars] + overflow_message
-            else:
-                return value.rstrip()
+            return self._split_text(
+                value,
+                overflow_message=overflow_message,
+                input_width=input_width,
+                preserve_newlines=preserve_newlines,
+                preserve_words=preserve_words,
+            )[0]
 
         # If the overflow item is a list or DAList
-        if isinstance(value, (list, DAList)):
-            return value[: self.overflow_trigger]
+        if isinstance(value, _LIST_TYPES):
+            return value[:overflow_trigger]
         else:
             # We can't slice objects that are not lists or strings
             # TODO: is it correct to return the whole object here?
             return value
 
+    def _split_text(
+        self,
+        value: str,
+        overflow_message: str = "",
+        input_width: int = 80,
+        preserve_newlines: bool = False,
+        preserve_words: bool = True,
+    ) -> Tuple[str, str]:
+        """
+        Split a string into the safe value and the overflow value, remembering both for the
+        rest of the page. Templates usually ask for both halves of the same field with the
+        same arguments, so computing them together means the text is only wrapped once.
+
+        Args:
+            value (str): The full text of the field.
+            overflow_message (str): A short message to go on the page where text is cutoff.
+            input_width (int): The width, in characters, of the input box. Defaults to 80.
+            preserve_newlines (bool): Determines whether newlines are preserved in the "safe" text.
+            preserve_words (bool): Indicates whether words should be preserved in their entirety without being split.
+
+        Returns:
+            Tuple[str, str]: The safe value and the overflow value.
+        """
+        cache = self._render_cache()
+        cache_key = (
+            "split_text",
+            self.overflow_trigger,
+            overflow_message,
+            input_width,
+            preserve_newlines,
+            preserve_words,
+            value,
+        )
+        if cache_key in cache:
+            return cache[cache_key]
+
+        # One pass gives us both the safe text and the whitespace-normalized value
+        # it was cut from.
+        # Note: if preserve newlines is False:
+        #   1. All single and double newlines are replaced with a space
+        #   2. Character count will adjust to reflect double-newlines being replaced with one char.
+        # If preserve newlines is True:
+        #   1. We replace all double newlines with \n.
+        #   2. Character count will adjust to reflect double-newlines being replaced with one char.
+        safe_text, value_to_process = self._safe_text(
+            value,
+            overflow_message=overflow_message,
+            input_width=input_width,
+            preserve_newlines=preserve_newlines,
+            preserve_words=preserve_words,
+        )
+        if safe_text == value_to_process:  # no overflow
+            overflow_text = ""
+        else:
+            # The safe value includes an overflow message. Delete the overflow message
+            # from the length of the safe value to get the starting character.
+            overflow_start = max(len(safe_text) - len(overflow_message), 0)
+            overflow_text = value_to_process[overflow_start:].lstrip()
+        cache[cache_key] = (safe_text, overflow_text)
+        return cache[cache_key]
+
+    def _safe_text(
+        self,
+        value: str,
+        overflow_message: str = "",
+        input_width: int = 80,
+        preserve_newlines: bool = False,
+        preserve_words: bool = True,
+    ) -> Tuple[str, str]:
+        """
+        Truncate a string to the portion that fits in the overflow trigger. Used by `safe_value()`
+        and `overflow_value()`, which handle caching and values that are not strings.
+
+        Args:
+            value (str): The full text of the field.
+            overflow_message (str): A short message to go on the page where text is cutoff.
+            input_width (int): The width, in characters, of the input box. Defaults to 80.
+            preserve_newlines (bool): Determines whether newlines are preserved in the "safe" text.
+            preserve_words (bool): Indicates whether words should be preserved in their entirety without being split.
+
+        Returns:
+            Tuple[str, str]: The portion of the text that fits within the overflow trigger, and the
+                full text with its whitespace normalized the same way, for finding the overflow.
+        """
+        overflow_trigger = self.overflow_trigger
+        original_value = value
+        fits = (
+            len(value) <= overflow_trigger and "\r" not in value and "\n" not in value
+        )
+        # Only compute the line limit when it can actually be used
+        max_lines = floor(overflow_trigger / input_width) if preserve_newlines else 0
+        # If we preserve newlines, we need to account for max_lines, not just max_chars
+        if preserve_newlines and max_lines > 1:
+            # Replace all new line characters with just \n. \r\n inserts two lines in a PDF
+            # Skip the regex entirely for the common case of a single-line value
+            if "\r" in value or "\n" in value:
+                value = _NEWLINE_RE.sub("\n", value)
+            value = value.rstrip()
+            # we do our own substitution of whitespace, only double newlines and runs of spaces
+            normalized_value = _MULTISPACE_RE.sub(" ", value)
+            if fits:
+                return original_value, normalized_value
+            # textwrap.wrap does all the hard work for us here
+            wrapper = _text_wrapper(
+                input_width,
+                max_lines=max_lines,
+                placeholder=overflow_message,
+                replace_whitespace=False,
+            )
+            safe_text = " ".join(wrapper.wrap(value))
+            return _MULTISPACE_RE.sub(" ", safe_text).rstrip(), normalized_value
+
+        # Strip newlines from strings because they take extra space
+        value = _WS_RE.sub(" ", value)
+        # textwrap.wrap(replace_whitespace=True) replaces all whitespace, not just double newlines and spaces
+        normalized_value = value.strip()
+        if fits:
+            return original_value, normalized_value
+        if len(value) > overflow_trigger:
+            # width needs to be at least 1 char
+            max_chars = max(overflow_trigger - len(overflow_message), 1)
+            if preserve_words:
+                safe_text = _first_wrapped_line(value, max_chars) + overflow_message
+            else:
+                safe_text = value.rstrip()[:max_chars] + overflow_message
+            return safe_text, normalized_value
+        return value.rstrip(), normalized_value
+
     def value_if_defined(self) -> Any:
         """
         Fetch the value of the designated field if it exists; otherwise, return an empty string.
@@ -556,7 +1201,10 @@ class ALAddendumField(DAObject):
         Returns:
             str: The string representation of the value contained within the field.
         """
-        return str(self.value_if_defined())
+        value = self._resolved_value()
+        if isinstance(value, str):
+            return value
+        return str(value)
 
     def columns(
         self, skip_empty_attributes: bool = True, skip_attributes: Optional[set] = None
@@ -579,47 +1227,103 @@ class ALAddendumField(DAObject):
         Note:
             The "location" attribute of an Address object is always skipped in the column list.
         """
-        if not skip_attributes:
-            skip_attributes = {"complete"}
         if hasattr(self, "headers"):
             return self.headers
-        else:
-            # Use the first row as an exemplar
-            try:
-                first_value = self.value_if_defined()[0]
-
-                if isinstance(first_value, dict) or isinstance(first_value, DADict):
-                    return list([{key: key} for key in first_value.keys()])
-                elif isinstance(first_value, DAObject):
-                    attr_to_ignore = {
-                        "has_nonrandom_instance_name",
-                        "instanceName",
-                        "attrList",
-                    }
-                    if skip_empty_attributes:
-                        return [
-                            {key: key}
-                            for key in list(
-                                set(first_value.__dict__.keys())
-                                - set(skip_attributes)
-                                - attr_to_ignore
-                            )
-                            if safeattr(first_value, key)
-                        ]
-                    else:
-                        return [
-                            {key: key}
-                            for key in list(
-                                set(first_value.__dict__.keys())
-                                - set(skip_attributes)
-                                - attr_to_ignore
-                            )
-                        ]
-                else:
-                    return None
-            except:
-                return None
+        column_keys = self._inferred_column_keys(
+            skip_empty_attributes=skip_empty_attributes,
+            skip_attributes=skip_attributes,
+        )
+        if column_keys is None:
             # None means the value has no meaningful columns we can extract
+            return None
+        return [{column_key: column_key} for column_key in column_keys]
+
+    def _column_pairs(self) -> Optional[List[Tuple[Any, Any]]]:
+        """
+        Return the default `columns()` as `(key, label)` pairs, without building a
+        dictionary for each inferred column.
+
+        Returns:
+            Optional[List[Tuple[Any, Any]]]: The key and label of each column, or None if
+                no meaningful columns can be determined.
+        """
+        if hasattr(self, "headers"):
+            if not self.headers:
+                return self.headers
+            return [(key(column), label(column)) for column in self.headers]
+        column_keys = self._inferred_column_keys()
+        if column_keys is None:
+            return None
+        return [(column_key, column_key) for column_key in column_keys]
+
+    def _inferred_column_keys(
+        self,
+        skip_empty_attributes: bool = True,
+        skip_attributes: Optional[Iterable[str]] = None,
+    ) -> Optional[List[Any]]:
+        """
+        Infer the column keys from the first value in the list. Used by `columns()`.
+
+        Args:
+            skip_empty_attributes (bool): Whether to leave out attributes that are empty on the exemplar.
+            skip_attributes (Optional[Iterable[str]]): Attributes to leave out. Defaults to {"complete"}.
+
+        Returns:
+            Optional[List[Any]]: The column keys, or None if no meaningful columns can be determined.
+        """
+        if not skip_attributes:
+            skip_attributes = _DEFAULT_SKIP_ATTRIBUTES
+        # Use the first row as an exemplar
+        try:
+            first_value = self._resolved_value()[0]
+
+            if isinstance(first_value, _DICT_TYPES):
+                return list(first_value.keys())
+            elif isinstance(first_value, DAObject):
+                # Templates usually ask for the columns more than once per page, and the
+                # exemplar's attributes rarely change in between
+                cache = self._render_cache()
+                cache_key = (
+                    "columns",
+                    skip_empty_attributes,
+                    frozenset(skip_attributes),
+                    id(first_value),
+                    frozenset(first_value.__dict__),
+                )
+                if cache_key not in cache:
+                    cache[cache_key] = self._object_column_keys(
+                        first_value, skip_empty_attributes, skip_attributes
+                    )
+                return list(cache[cache_key])
+            else:
+                return None
+        except:
+            return None
+
+    def _object_column_keys(
+        self,
+        first_value: DAObject,
+        skip_empty_attributes: bool,
+        skip_attributes: Iterable[str],
+    ) -> List[str]:
+        """
+        Find the attributes of a DAObject that should be columns, using the object as an exemplar.
+
+        Args:
+            first_value (DAObject): The first object in the list.
+            skip_empty_attributes (bool): Whether to leave out attributes that are empty on the exemplar.
+            skip_attributes (Iterable[str]): Attributes to leave out.
+
+        Returns:
+            List[str]: The attribute names to use as columns.
+        """
+        # dict key views support set operations directly, so the keys are not copied into a set first
+        keys = (first_value.__dict__.keys() - _ATTR_IGNORE).difference(skip_attributes)
+        return [
+            key
+            for key in keys
+            if not skip_empty_attributes or safeattr(first_value, key)
+        ]
 
     def type(self) -> str:
         """
@@ -633,13 +1337,9 @@ class ALAddendumField(DAObject):
         Returns:
             str: The type category of the value.
         """
-        value = self.value_if_defined()
-        if isinstance(value, list) or isinstance(value, DAList):
-            if len(value) and (
-                isinstance(value[0], dict)
-                or isinstance(value[0], DADict)
-                or isinstance(value[0], DAObject)
-            ):
+        value = self._resolved_value()
+        if isinstance(value, _LIST_TYPES):
+            if len(value) and isinstance(value[0], _OBJ_CONTAINER_TYPES):
                 return "object_list"
             return "list"
         return "other"
@@ -673,45 +1373,35 @@ class ALAddendumField(DAObject):
         Returns:
             str: A markdown representation of the overflow values.
         """
-        columns = self.columns()
+        columns = self._column_pairs()
+        overflow = self.overflow_value()
         if not columns:
-            if self.overflow_value():
-                retval = "* "
-                retval += "\n* ".join(self.overflow_value())
-                return retval + "\n"
+            if overflow:
+                return "* " + "\n* ".join(overflow) + "\n"
             else:
                 return ""
 
-        num_columns = len(columns)
-
-        header = " | ".join([list(item.items())[0][1] for item in columns])
-        header += "\n"
-        header += "|".join(["-----"] * num_columns)
+        parts = [
+            " | ".join([column_label for _, column_label in columns]),
+            "\n",
+            "|".join(["-----"] * len(columns)),
+            "\n",
+        ]
+        append = parts.append
 
-        flattened_columns = []
-        for column in columns:
-            flattened_columns.append(list(column.items())[0][0])
+        flattened_columns = tuple(column_key for column_key, _ in columns)
+        getter = _attributes_getter(flattened_columns)
 
-        rows = "\n"
-        for row in self.overflow_value():
-            if isinstance(row, dict) or isinstance(row, DADict):
-                row_values = []
-                for column in flattened_columns:
-                    row_values.append(str(row.get(column, "")))
-                rows += "|".join(row_values)
+        for row in overflow:
+            if isinstance(row, _DICT_TYPES):
+                append(
+                    "|".join([str(row.get(column, "")) for column in flattened_columns])
+                )
             else:
-                row_values = []
-                for column in flattened_columns:
-                    # don't trigger collecting attributes that are required to resolve
-                    # to a string
-                    try:
-                        row_values.append(str(getattr(row, column, "")))
-                    except:
-                        row_values.append("")
-                rows += "|".join(row_values)
-            rows += "\n"
-
-        return header + rows
+                append("|".join(_attributes_as_str(getter, row, flattened_columns)))
+            append("\n")
+
+        return "".join(parts)
 
     def overflow_docx(
         self,
@@ -779,7 +1469,7 @@ class ALAddendumFieldDict(DAOrderedDict):
         """
         the_key = pargs[0]
         newobj = super().initializeObject(*pargs, **kwargs)
-        self[the_key].field_name = the_key
+        newobj.field_name = the_key
         return newobj
 
     def from_list(self, data: List[Dict]) -> None:
@@ -791,9 +1481,12 @@ class ALAddendumFieldDict(DAOrderedDict):
                 and "overflow_trigger".
         """
         for entry in data:
-            new_field = self.initializeObject(entry["field_name"], ALAddendumField)
-            new_field.field_name = entry["field_name"]
-            new_field.overflow_trigger = entry["overflow_trigger"]
+            # Passing the trigger to the constructor sets it during init
+            self.initializeObject(
+                entry["field_name"],
+                ALAddendumField,
+                overflow_trigger=entry["overflow_trigger"],
+            )
         return
 
     def defined_fields(self, style: str = "overflow_only") -> list:
@@ -810,7 +1503,7 @@ class ALAddendumFieldDict(DAOrderedDict):
         if style == "overflow_only":
             return [field for field in self.values() if len(field.overflow_value())]
         else:
-            return [field for field in self.values() if defined(field.field_name)]
+            return [field for field in self.values() if field._is_defined()]
 
     def overflow(self) -> list:
         """
@@ -828,10 +1521,7 @@ class ALAddendumFieldDict(DAOrderedDict):
         Returns:
             bool: True if at least one field overflows, False otherwise.
         """
-        for field in self.values():
-            if field.overflow_value():
-                return True
-        return False
+        return any(field.overflow_value() for field in self.values())
 
 
 class DALazyAttribute(DAObject):
@@ -846,21 +1536,92 @@ class DALazyAttribute(DAObject):
         instanceName (str): A unique identifier for the object instance, if available.
     """
 
-    def __getstate__(self) -> dict:
+    def __getstate__(self) -> tuple:
         """
         Overrides the default method used by Pickle for object serialization.
 
         If the object has an `instanceName` attribute, it is retained during serialization.
-        Otherwise, an empty dictionary is returned, ensuring that other attributes are not
+        Otherwise, an empty tuple is returned, ensuring that other attributes are not
         persisted across page loads.
 
         Returns:
-            dict: A dictionary containing only the `instanceName` if it exists, or empty otherwise.
+            tuple: A tuple containing only the `instanceName` if it exists, or empty otherwise.
         """
-        if hasattr(self, "instanceName"):
-            return dict(instanceName=self.instanceName)
-        else:
-            return dict()
+        if "instanceName" in self.__dict__:
+            return (self.__dict__["instanceName"],)
+        return ()
+
+    def __setstate__(self, state: Union[tuple, dict]) -> None:
+        """
+        Restores the object from the state returned by `__getstate__`.
+
+        Args:
+            state (Union[tuple, dict]): The saved state. Interviews saved by older versions
+                of this class store a dictionary instead of a tuple.
+        """
+        if isinstance(state, dict):
+            self.__dict__.update(state)
+        elif state:
+            self.__dict__["instanceName"] = state[0]
+
+
+class _LazyPDF:
+    """
+    Stands in for the DAFile returned by `as_pdf()` without assembling it. The PDF is
+    assembled the first time any attribute of the file is used, e.g. `url_for()`,
+    `path()` or `show()`, and the same file is used from then on.
+
+    Only meant to be used within a single page. Don't save it in the interview answers.
+    """
+
+    def __init__(self, document: Any, **kwargs):
+        """
+        Remember how to assemble the PDF, without assembling it yet.
+
+        Args:
+            document (Any): The ALDocument or ALDocumentBundle to assemble.
+            **kwargs: Keyword arguments to pass to the document's `as_pdf()` method.
+        """
+        self._document = document
+        self._kwargs = kwargs
+        self._pdf = None
+
+    def _resolve(self) -> Any:
+        """
+        Assemble the PDF the first time it is needed.
+
+        Returns:
+            Any: The DAFile returned by the document's `as_pdf()` method.
+        """
+        if self._pdf is None:
+            self._pdf = self._document.as_pdf(**self._kwargs)
+        return self._pdf
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Look up public attributes on the assembled PDF.
+
+        Private names are not passed on, so that `hasattr()` checks and pickling
+        don't assemble the PDF.
+
+        Args:
+            name (str): The name of the attribute.
+
+        Returns:
+            Any: The attribute of the assembled PDF.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __str__(self) -> str:
+        """
+        Assemble the PDF and return its string form, like the DAFile would.
+
+        Returns:
+            str: The string form of the assembled PDF.
+        """
+        return str(self._resolve())
 
 
 class ALDocument(DADict):
@@ -990,6 +1751,9 @@ class ALDocument(DADict):
         ```
     """
 
+    # Class-level default, so documents saved before the attribute existed still have it
+    suffix_to_append = "preview"
+
     def init(self, *pargs, **kwargs):
         super(ALDocument, self).init(*pargs, **kwargs)
         self.initializeAttribute("overflow_fields", ALAddendumFieldDict)
@@ -999,9 +1763,6 @@ class ALDocument(DADict):
             self.has_addendum = False
         self.initializeAttribute("cache", DALazyAttribute)
         self.always_enabled = hasattr(self, "enabled") and self.enabled
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
 
     def as_pdf(
         self,
@@ -1024,60 +1785,87 @@ class ALDocument(DADict):
         """
         # Trigger some stuff up front to avoid idempotency problems
         self.title
-        self.need_addendum()
+        needs_addendum = self.need_addendum()
 
-        safe_key = space_to_underscore(key)
+        cache_key = _pdf_cache_key(key, pdfa)
 
-        if not hasattr(self, "suffix_to_append"):
-            self.suffix_to_append = "preview"
-        if append_matching_suffix and key == self.suffix_to_append:
-            append_suffix: str = f"_{safe_key}"
-        else:
-            append_suffix = ""
-        filename = f"{base_name(self.filename)}{append_suffix}.pdf"
+        # Check the cache before any other work, so a cached file is never re-assembled
+        if hasattr(self.cache, cache_key):
+            return getattr(self.cache, cache_key)
 
-        # The PDF/A version of the document is a different file than the normal PDF,
-        # so differentiate that when checking the cache
-        if pdfa:
-            safe_key = safe_key + "-pdfa"
-
-        if hasattr(self.cache, safe_key):
-            return getattr(self.cache, safe_key)
+        append_suffix = (
+            f"_{_space_to_underscore(key)}"
+            if append_matching_suffix and key == self.suffix_to_append
+            else ""
+        )
+        filename = f"{self._base_name()}{append_suffix}.pdf"
 
         if refresh:
             main_doc = self.getitem_fresh(key)
         else:
             main_doc = self[key]
 
-        if isinstance(main_doc, DAFileCollection):
+        main_is_collection = isinstance(main_doc, DAFileCollection)
+        if main_is_collection:
             main_doc = main_doc.pdf
             main_doc.title = self.title
             main_doc.filename = filename
             try:
-                main_doc.set_attributes(filename=filename)
-                main_doc.set_mimetype("application/pdf")
-            except:
-                pass
-
-        if self.need_addendum():
+                if hasattr(main_doc, "set_attributes"):
+                    main_doc.set_attributes(filename=filename)
+                if hasattr(main_doc, "set_mimetype"):
+                    main_doc.set_mimetype("application/pdf")
+            except Exception as ex:
+                log(f"Could not set the filename or mimetype of {filename}: {ex}")
+
+        if needs_addendum:
             if refresh:
                 addendum_doc = self.getattr_fresh("addendum")
             else:
                 addendum_doc = self.addendum
-            if isinstance(main_doc, DAFileCollection):
+            if main_is_collection:
                 addendum_doc = addendum_doc.pdf
             concatenated = pdf_concatenate(
                 main_doc, addendum_doc, filename=filename, pdfa=pdfa
             )
             concatenated.title = self.title
-            setattr(self.cache, safe_key, concatenated)
+            setattr(self.cache, cache_key, concatenated)
             return concatenated
         else:
             if pdfa:
                 pdf_to_pdfa(main_doc.path())
-            setattr(self.cache, safe_key, main_doc)
+            setattr(self.cache, cache_key, main_doc)
             return main_doc
 
+    def as_pdf_lazy(
+        self,
+        key: str = "final",
+        refresh: bool = True,
+        pdfa: bool = False,
+        append_matching_suffix: bool = True,
+    ) -> Any:
+        """
+        Returns a stand-in for `as_pdf()` that only assembles the PDF when it is first used,
+        for example when a template calls `url_for()` on it. Use this when a page might
+        not need the PDF at all.
+
+        Args:
+            key (str): Document version key. Defaults to "final".
+            refresh (bool): If True, generates the attachment anew each time. Defaults to True.
+            pdfa (bool): If True, generates a PDF/A compliant document. Defaults to False.
+            append_matching_suffix (bool): If True, appends the key as a suffix to the filename when it matches the suffix to append. Defaults to True.
+
+        Returns:
+            Any: An object that behaves like the DAFile returned by `as_pdf()`.
+        """
+        return _LazyPDF(
+            self,
+            key=key,
+            refresh=refresh,
+            pdfa=pdfa,
+            append_matching_suffix=append_matching_suffix,
+        )
+
     def as_docx(
         self,
         key: str = "final",
@@ -1095,19 +1883,27 @@ class ALDocument(DADict):
         Returns:
             DAFile: Assembled document in DOCX or PDF format.
         """
-        if append_matching_suffix and key == self.suffix_to_append:
-            filename = f"{base_name(self.filename)}_{key}"
-        else:
-            filename = f"{base_name(self.filename)}"
+        filename = (
+            f"{self._base_name()}_{key}"
+            if append_matching_suffix and key == self.suffix_to_append
+            else self._base_name()
+        )
         if self.need_addendum():
+            # get_cacheable_documents() and as_zip() both ask for the DOCX; only
+            # concatenate it once per page load. The filename depends on
+            # append_matching_suffix, so it is part of the cache key.
+            cache_key = f"{_space_to_underscore(key)}-docx-{filename}"
+            if hasattr(self.cache, cache_key):
+                return getattr(self.cache, cache_key)
             try:
                 the_file = docx_concatenate(
                     self.as_list(key=key, refresh=refresh),
                     filename=filename + ".docx",
                 )
                 the_file.title = self.title
+                setattr(self.cache, cache_key, the_file)
                 return the_file
-            except:
+            except Exception:
                 return self.as_pdf(key=key)
 
         if self._is_docx(key=key):
@@ -1118,6 +1914,20 @@ class ALDocument(DADict):
 
         return self.as_pdf(key=key, append_matching_suffix=append_matching_suffix)
 
+    def _base_name(self) -> str:
+        """
+        Returns the document's filename without its extension, remembering the
+        answer for the rest of the page as long as the filename does not change.
+
+        Returns:
+            str: The base name of `self.filename`.
+        """
+        filename = self.filename
+        if hasattr(self.cache, "_base_name") and self.cache._base_name[0] == filename:
+            return self.cache._base_name[1]
+        self.cache._base_name = (filename, base_name(filename))
+        return self.cache._base_name[1]
+
     def _is_docx(self, key: str = "final") -> bool:
         """
         Checks if the document file format is DOCX.
@@ -1128,12 +1938,14 @@ class ALDocument(DADict):
         Returns:
             bool: True if the document format is DOCX, False otherwise.
         """
-        if isinstance(self[key], DAFileCollection) and hasattr(self[key], "docx"):
-            return True
-        if isinstance(self[key], DAFile) and hasattr(self[key], "docx"):
-            return True
-
-        return False
+        if not hasattr(self.cache, "_is_docx"):
+            self.cache._is_docx = {}
+        if key not in self.cache._is_docx:
+            the_file = self[key]
+            self.cache._is_docx[key] = isinstance(
+                the_file, (DAFileCollection, DAFile)
+            ) and hasattr(the_file, "docx")
+        return self.cache._is_docx[key]
 
     def as_list(self, key: str = "final", refresh: bool = True) -> List[DAFile]:
         """
@@ -1146,13 +1958,14 @@ class ALDocument(DADict):
         Returns:
             List[DAFile]: List containing the main document and possibly its addendum.
         """
+        needs_addendum = self.has_addendum and self.has_overflow()
         if refresh:
-            if self.has_addendum and self.has_overflow():
+            if needs_addendum:
                 return [self.getitem_fresh(key), self.getattr_fresh("addendum")]
             else:
                 return [self.getitem_fresh(key)]
         else:
-            if self.has_addendum and self.has_overflow():
+            if needs_addendum:
                 return [self[key], self.addendum]
             else:
                 return [self[key]]
@@ -1176,7 +1989,10 @@ class ALDocument(DADict):
         Returns:
             bool: True if there are overflow fields, False otherwise.
         """
-        return self.overflow_fields.has_overflow()
+        # Most documents have no fields that could overflow
+        if not self.overflow_fields.elements:
+            return False
+        return self._scan_overflow()
 
     def overflow(self) -> list:
         """
@@ -1185,7 +2001,21 @@ class ALDocument(DADict):
         Returns:
             list: List of overflow fields.
         """
-        return self.overflow_fields.overflow()
+        self._scan_overflow()
+        return list(self.cache._overflow)
+
+    def _scan_overflow(self) -> bool:
+        """
+        Walks the overflow fields once, caching both the list of overflowing fields
+        and whether there are any for the rest of the page load.
+
+        Returns:
+            bool: True if there are overflow fields, False otherwise.
+        """
+        if not hasattr(self.cache, "_has_overflow"):
+            self.cache._overflow = self.overflow_fields.overflow()
+            self.cache._has_overflow = bool(self.cache._overflow)
+        return self.cache._has_overflow
 
     def original_or_overflow_message(
         self,
@@ -1345,6 +2175,9 @@ class ALStaticDocument(DAStaticFile):
         Consider handling files in `/data/templates` if deemed useful, potentially by copying into a DAFile using `pdf_concatenate()`.
     """
 
+    # When the key is "preview", append it to the file name
+    suffix_to_append = "preview"
+
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
         self.has_addendum = False
@@ -1352,9 +2185,6 @@ class ALStaticDocument(DAStaticFile):
         self.gathered = True
         self.initializeAttribute("cache", DALazyAttribute)
         self.always_enabled = hasattr(self, "enabled") and self.enabled
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
 
     def __getitem__(self, key):
         """
@@ -1476,6 +2306,48 @@ class ALStaticDocument(DAStaticFile):
         return self.enabled
 
 
+# Pieces of ALDocumentBundle.send_button_html(), filled in with str.format()
+_SEND_FIELDSET_HEADER_TEMPLATE = """
+  <fieldset class="al_send_bundle al_send_section_alone {name}" id="al_send_bundle_{name}" name="al_send_bundle_{name}">
+    <legend class="h4 al_doc_email_header">{email_header}</legend> 
+    """
+_SEND_EDITABLE_CHECKBOX_TEMPLATE = """
+    <div class="form-check-container">
+      <div class="form-check">
+        <input class="form-check-input" type="checkbox" class="al_wants_editable" id="{al_wants_editable_input_id}">
+        <label class="al_wants_editable form-check-label" for="{al_wants_editable_input_id}">{include_editable_label}
+        </label>
+      </div>
+    </div>
+  """
+_SEND_EMAIL_INPUT_TEMPLATE = """
+  <div class="al_email_container">
+  
+    <span class="al_email_address {name} container form-group row da-field-container da-field-container-datatype-email">
+      <label for="{al_email_input_id}" class="col-form-label da-form-label datext-right">Email</label>
+      <input value="{email}" alt="Email address for document" class="form-control" type="email" size="35" name="{al_email_input_id}" id="{al_email_input_id}">
+    </span>
+    
+    {send_button}
+
+  </div>
+  """
+
+# Pieces of ALDocumentBundle.send_email_table_row()
+_SEND_ROW_EMAIL_INPUT_TEMPLATE = """
+        <span class="al_email_input_container {name} form-group da-field-container da-field-container-datatype-email">
+          <label for="{al_email_input_id}" class="col-form-label da-form-label datext-right">Email</label>
+          <input value="{email}" alt="Email address for document" class="form-control al_doc_email_field al_button" type="email" size="35" name="{al_email_input_id}" id="{al_email_input_id}">
+        </span>
+        """
+_SEND_ROW_TEMPLATE = """
+        <div class="row al_doc_table_row al_send_bundle {name}" id="al_send_bundle_{name}" name="al_send_bundle_{name}">
+          <div class="col col-12 col-sm-9 al_email_input_col">{input_html}</div>
+          <div class="col col-12 col-sm-3 al_email_send_col al_buttons">{send_button}</div>
+        </div>
+        """
+
+
 class ALDocumentBundle(DAList):
     """
     A collection of ALDocuments or nested ALDocumentBundles, represented as a DAList.
@@ -1515,6 +2387,9 @@ class ALDocumentBundle(DAList):
         ```
     """
 
+    # When the key is "preview", append it to the file name
+    suffix_to_append = "preview"
+
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
         if "auto_gather" not in kwargs:
@@ -1523,11 +2398,6 @@ class ALDocumentBundle(DAList):
             self.gathered = True
         self.initializeAttribute("cache", DALazyAttribute)
         self.always_enabled = hasattr(self, "enabled") and self.enabled
-        # Pre-cache some DALazyTemplates we set up to aid translation that won't
-        # vary at runtime
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
 
     def as_pdf(
         self,
@@ -1552,24 +2422,26 @@ class ALDocumentBundle(DAList):
         Returns:
             Optional[DAFile]: Combined PDF file or None if no documents are enabled.
         """
-        safe_key = space_to_underscore(key)
-        if pdfa:
-            safe_key = safe_key + "-pdfa"
-
-        if hasattr(self.cache, safe_key):
-            return getattr(self.cache, safe_key)
+        cache_key = _pdf_cache_key(key, pdfa)
+        if hasattr(self.cache, cache_key):
+            return getattr(self.cache, cache_key)
 
         # When running automated tests, the "preview" version of the file is
         # downloaded along with the final. Previously, the final version
         # ovewrote the preview version. This makes the tests more useful by
         # appending _preview to the name of the preview document.
-        if not hasattr(self, "suffix_to_append"):  # for existing interviews
-            self.suffix_to_append = "preview"
         if append_matching_suffix and key == self.suffix_to_append:
             append_suffix: str = f"_{key}"
         else:
             append_suffix = ""
+        if hasattr(self, "default_parity") and not ensure_parity:
+            ensure_parity = self.default_parity
+
+        if ensure_parity not in [None, "even", "odd"]:
+            raise ValueError("ensure_parity must be either 'even', 'odd' or None")
+
         files = self.enabled_documents(refresh=refresh)
+        parity_done = False
         if len(files) == 0:
             # In the case of no enabled files, avoid errors
             return None
@@ -1581,29 +2453,55 @@ class ALDocumentBundle(DAList):
                 pdfa=pdfa,
                 append_matching_suffix=append_matching_suffix,
             )
-            pdf.title = self.title
         else:
-            pdf = pdf_concatenate(
-                [document.as_pdf(key=key, refresh=refresh) for document in files],
-                filename=f"{base_name(self.filename)}{append_suffix}.pdf",
-                pdfa=pdfa,
-            )
+            pdfs = self._enabled_pdfs(key=key, refresh=refresh)
+            filename = f"{self._base_name()}{append_suffix}.pdf"
+            # PDF/A output still needs pdf_concatenate's conversion step
+            pdf = None if pdfa else _fast_concatenate(pdfs, filename, ensure_parity)
+            if pdf is None:
+                pdf = pdf_concatenate(pdfs, filename=filename, pdfa=pdfa)
+            else:
+                # The blank page, if any, was added while concatenating
+                parity_done = True
         pdf.title = self.title
-        setattr(self.cache, safe_key, pdf)
+        setattr(self.cache, cache_key, pdf)
 
-        if hasattr(self, "default_parity") and not ensure_parity:
-            ensure_parity = self.default_parity
+        if ensure_parity and not parity_done:  # Check for odd/even requirement
+            ensure_pdf_page_parity(pdf.path(), ensure_parity)
 
-        if ensure_parity not in [None, "even", "odd"]:
-            raise ValueError("ensure_parity must be either 'even', 'odd' or None")
+        return pdf
+
+    def as_pdf_lazy(
+        self,
+        key: str = "final",
+        refresh: bool = True,
+        pdfa: bool = False,
+        append_matching_suffix: bool = True,
+        ensure_parity: Optional[Literal["even", "odd"]] = None,
+    ) -> Any:
+        """
+        Returns a stand-in for `as_pdf()` that only assembles the bundle's PDF when it is
+        first used, for example when a template calls `url_for()` on it.
 
-        if ensure_parity:  # Check for odd/even requirement
-            if pdf_page_parity(pdf.path()) == ensure_parity:
-                return pdf
-            else:
-                add_blank_page(pdf.path())
+        Args:
+            key (str): Identifier for the document version, default is "final".
+            refresh (bool): Flag to return a newly assembled version, default is True.
+            pdfa (bool): If True, generates a PDF/A compliant document, defaults to False.
+            append_matching_suffix (bool): Flag to determine if matching suffix should be appended to file name, default is True.
+            ensure_parity (Optional[Literal["even", "odd"]]): Ensures the number of pages in the PDF is even or odd. If omitted,
+                no parity is enforced. Defaults to None.
 
-        return pdf
+        Returns:
+            Any: An object that behaves like the DAFile returned by `as_pdf()`.
+        """
+        return _LazyPDF(
+            self,
+            key=key,
+            refresh=refresh,
+            pdfa=pdfa,
+            append_matching_suffix=append_matching_suffix,
+            ensure_parity=ensure_parity,
+        )
 
     def __str__(self) -> str:
         """
@@ -1617,6 +2515,53 @@ class ALDocumentBundle(DAList):
         # Could be triggered in many different places unintentionally: don't refresh
         return str(self.as_pdf(refresh=False))
 
+    def _base_name(self) -> str:
+        """
+        Returns the bundle's filename without its extension, remembering the
+        answer for the rest of the page as long as the filename does not change.
+
+        Returns:
+            str: The base name of `self.filename`.
+        """
+        filename = str(self.filename)
+        if hasattr(self.cache, "_base_name") and self.cache._base_name[0] == filename:
+            return self.cache._base_name[1]
+        self.cache._base_name = (filename, base_name(filename))
+        return self.cache._base_name[1]
+
+    def _safe_name(self) -> str:
+        """
+        Returns the bundle's instanceName in a form that is safe to use in HTML
+        classes and IDs, remembering it for the rest of the page load.
+
+        Returns:
+            str: `self.instanceName`, passed through `html_safe_str()`.
+        """
+        if (
+            hasattr(self.cache, "_safe_name")
+            and self.cache._safe_name[0] == self.instanceName
+        ):
+            return self.cache._safe_name[1]
+        self.cache._safe_name = (self.instanceName, html_safe_str(self.instanceName))
+        return self.cache._safe_name[1]
+
+    def _event_name(self, event: str) -> str:
+        """
+        Returns the full name of one of the bundle's action events, like
+        `self.attr_name(event)`, remembering it for the rest of the page load.
+
+        Args:
+            event (str): The name of the event attribute, like "send_email_action_event"
+
+        Returns:
+            str: The full variable name of the event.
+        """
+        if not hasattr(self.cache, "_event_names"):
+            self.cache._event_names = {}
+        if event not in self.cache._event_names:
+            self.cache._event_names[event] = self.attr_name(event)
+        return self.cache._event_names[event]
+
     def as_zip(
         self,
         key: str = "final",
@@ -1641,14 +2586,14 @@ class ALDocumentBundle(DAList):
             DAFile: A zip file containing the enabled documents.
         """
 
-        zip_key = f"{ space_to_underscore( key )}_zip"
+        zip_key = f"{_space_to_underscore(key)}_zip"
 
         # Speed up performance if can (docs say `zip_file` works like `pdf_concatenate`)
         if hasattr(self.cache, zip_key):
             return getattr(self.cache, zip_key)
 
         # strip out a possible '.pdf' ending then add '.zip'
-        zipname = os.path.splitext(self.filename)[0]
+        zipname = self._base_name()
         if format == "docx":
             docs = []
             for doc in self.enabled_documents(refresh=refresh):
@@ -1659,15 +2604,8 @@ class ALDocumentBundle(DAList):
             # We don't try to convert to PDF if format=="original" (for things like XLSX files)
             docs = [doc[key] for doc in self.enabled_documents(refresh=refresh)]
         else:
-            docs = [
-                doc.as_pdf(
-                    key=key,
-                    refresh=refresh,
-                    pdfa=pdfa,
-                )
-                for doc in self.enabled_documents(refresh=refresh)
-            ]
-        zip = zip_file(docs, filename=zipname + ".zip")
+            docs = self._enabled_pdfs(key=key, refresh=refresh, pdfa=pdfa)
+        zip = _zip_documents(docs, filename=zipname + ".zip")
         if title == "":
             zip.title = self.title
         else:
@@ -1698,6 +2636,9 @@ class ALDocumentBundle(DAList):
         Returns:
             bool: True if there's at least one enabled document, otherwise False.
         """
+        # Reuse the answer from enabled_documents() if it already ran this page load
+        if hasattr(self.cache, "_enabled_documents"):
+            return bool(self.cache._enabled_documents)
         return any(document.is_enabled(refresh=refresh) for document in self.elements)
 
     def enabled_documents(self, refresh: bool = True) -> List[Any]:
@@ -1710,11 +2651,59 @@ class ALDocumentBundle(DAList):
         Returns:
             List[Any]: List of enabled documents.
         """
-        return [
+        # as_pdf(), as_zip() and the download helpers each ask for this list; a
+        # refreshed answer stays valid for the rest of the page load
+        if refresh and hasattr(self.cache, "_enabled_documents"):
+            return list(self.cache._enabled_documents)
+        enabled = [
             document
             for document in self.elements
             if document.is_enabled(refresh=refresh)
         ]
+        if refresh:
+            self.cache._enabled_documents = enabled
+            return list(enabled)
+        return enabled
+
+    def _enabled_pdfs(
+        self,
+        key: str = "final",
+        refresh: bool = True,
+        pdfa: bool = False,
+        append_matching_suffix: bool = True,
+    ) -> List[DAFile]:
+        """
+        Returns the PDF of each enabled document. The list is shared for the rest of
+        the page load by `as_pdf()`, `as_zip()`, `as_pdf_list()` and `get_cacheable_documents()`.
+
+        Args:
+            key (str): Identifier for the document version, default is "final".
+            refresh (bool): Flag to reconsider the 'enabled' attribute, default is True.
+            pdfa (bool): Flag to return the documents in PDF/A format, default is False.
+            append_matching_suffix (bool): Flag to determine if matching suffix should be appended to file name, default is True.
+
+        Returns:
+            List[DAFile]: The PDF of each enabled document, in order.
+        """
+        cache_key = f"_enabled_pdfs_{_pdf_cache_key(key, pdfa)}"
+        if refresh and hasattr(self.cache, cache_key):
+            return list(getattr(self.cache, cache_key))
+        # DOCX templates are converted to PDF by docassemble when each attachment is
+        # assembled (the `.pdf` of its DAFileCollection), so there is no
+        # conversion left to batch here
+        pdfs = [
+            document.as_pdf(
+                key=key,
+                refresh=refresh,
+                pdfa=pdfa,
+                append_matching_suffix=append_matching_suffix,
+            )
+            for document in self.enabled_documents(refresh=refresh)
+        ]
+        if refresh:
+            setattr(self.cache, cache_key, pdfs)
+            return list(pdfs)
+        return pdfs
 
     def as_flat_list(self, key: str = "final", refresh: bool = True) -> List[DAFile]:
         """
@@ -1727,16 +2716,9 @@ class ALDocumentBundle(DAList):
         Returns:
             List[DAFile]: Flattened list of enabled documents.
         """
-        # Iterate through the list of self.templates
-        # Unpack the list of documents at each step so this can be concatenated into a single list
         flat_list = []
-        for document in self.enabled_documents(refresh=refresh):
-            if isinstance(document, ALDocumentBundle):
-                # call the bundle's as_flat_list() method to show all enabled templates.
-                flat_list.extend(document.as_flat_list(key=key, refresh=refresh))
-            # This is a simple document node; check if this individual template is enabled.
-            else:  # base case
-                flat_list.extend(document.as_list(key=key, refresh=refresh))
+        for document in self._walk_enabled_documents(refresh=refresh):
+            flat_list.extend(document.as_list(key=key, refresh=refresh))
         return flat_list
 
     def get_titles(self, key: str = "final", refresh: bool = True) -> List[str]:
@@ -1750,13 +2732,31 @@ class ALDocumentBundle(DAList):
         Returns:
             List[str]: Titles of the enabled documents.
         """
-        flat_list = []
-        for document in self.enabled_documents(refresh=refresh):
-            if isinstance(document, ALDocumentBundle):
-                flat_list.extend(document.get_titles(key=key, refresh=refresh))
+        return [
+            document.title for document in self._walk_enabled_documents(refresh=refresh)
+        ]
+
+    def _walk_enabled_documents(self, refresh: bool = True) -> Iterable[Any]:
+        """
+        Yields the enabled documents of this bundle in order, replacing each nested
+        bundle with its own enabled documents. Walks the bundles with a stack instead
+        of recursion.
+
+        Args:
+            refresh (bool): Flag to reconsider the 'enabled' attribute, default is True.
+
+        Returns:
+            Iterable[Any]: The enabled documents that aren't bundles.
+        """
+        stack = [iter(self.enabled_documents(refresh=refresh))]
+        while stack:
+            for document in stack[-1]:
+                if isinstance(document, ALDocumentBundle):
+                    stack.append(iter(document.enabled_documents(refresh=refresh)))
+                    break
+                yield document
             else:
-                flat_list.append(document.title)
-        return flat_list
+                stack.pop()
 
     def as_pdf_list(
         self, key: str = "final", refresh: bool = True, pdfa: bool = False
@@ -1772,10 +2772,7 @@ class ALDocumentBundle(DAList):
         Returns:
             List[DAFile]: List of enabled documents as individual PDFs.
         """
-        return [
-            doc.as_pdf(key=key, refresh=refresh, pdfa=pdfa)
-            for doc in self.enabled_documents(refresh=refresh)
-        ]
+        return self._enabled_pdfs(key=key, refresh=refresh, pdfa=pdfa)
 
     def as_docx_list(self, key: str = "final", refresh: bool = True) -> List[DAFile]:
         """
@@ -1810,18 +2807,29 @@ class ALDocumentBundle(DAList):
         Returns:
             List[DAFile]: Flat list of documents in DOCX or RTF formats or their original format.
         """
-        docs = self.as_flat_list(key=key, refresh=refresh)
-        editable = []
-        for doc in docs:
+        return list(self._iter_editable(key=key, refresh=refresh))
+
+    def _iter_editable(self, key: str = "final", refresh: bool = True):
+        """
+        Yields the editable version of each document, like `as_editable_list()`,
+        without building the list.
+
+        Args:
+            key (str): Identifier for the document version, default is "final".
+            refresh (bool): Flag to reconsider the 'enabled' attribute, default is True.
+
+        Yields:
+            DAFile: Each document in DOCX or RTF format, or its original format.
+        """
+        for doc in self.as_flat_list(key=key, refresh=refresh):
             if hasattr(doc, "docx"):
-                editable.append(doc.docx)
+                yield doc.docx
             elif hasattr(doc, "rtf"):
-                editable.append(doc.rtf)
+                yield doc.rtf
             else:
                 # The whole DAFile should still be appendable
                 # for custom filetypes like PNG, etc.
-                editable.append(doc)
-        return editable
+                yield doc
 
     def get_cacheable_documents(
         self,
@@ -1861,23 +2869,32 @@ class ALDocumentBundle(DAList):
         Returns:
             Tuple[List[Dict[str, DAFile]], Optional[DAFile], Optional[DAFile]]: A list of dictionaries containing the enabled documents, a zip file of the whole bundle, and a PDF of the whole
         """
-        # reduce idempotency delays
+        # reduce idempotency delays: ask for any undefined titles before
+        # assembling files, and reuse them for the rows below
         enabled_docs = self.enabled_documents(refresh=refresh)
-        for doc in enabled_docs:
-            doc.title
+        titles = [doc.title for doc in enabled_docs]
 
         results = []
 
-        for doc in enabled_docs:
-            result = {"title": doc.title}
-            filename_root = os.path.splitext(str(doc.filename))[0]
+        # Assembled one at a time on purpose: docassemble keeps the interview's
+        # state in thread-local storage, so as_pdf() can't run in a worker thread
+        if pdf:
+            # Shared with as_zip() and as_pdf() below
+            pdfs = self._enabled_pdfs(
+                key=key,
+                refresh=refresh,
+                pdfa=pdfa,
+                append_matching_suffix=append_matching_suffix,
+            )
+
+        for index, doc in enumerate(enabled_docs):
+            result = {"title": titles[index]}
+            if isinstance(doc, (ALDocument, ALDocumentBundle)):
+                filename_root = doc._base_name()
+            else:
+                filename_root = os.path.splitext(str(doc.filename))[0]
             if pdf:
-                result["pdf"] = doc.as_pdf(
-                    key=key,
-                    refresh=refresh,
-                    pdfa=pdfa,
-                    append_matching_suffix=append_matching_suffix,
-                )
+                result["pdf"] = pdfs[index]
                 result["download_filename"] = filename_root + ".pdf"
             if docx and doc._is_docx(key=key):
                 result["docx"] = doc.as_docx(
@@ -1898,32 +2915,48 @@ class ALDocumentBundle(DAList):
                     download_doc = result["original"]
                 else:
                     download_doc = result["docx"]
-                ext = next(
-                    iter(
-                        mimetypes.guess_all_extensions(
-                            download_doc.mimetype, strict=True
-                        )
-                    )
-                )
-                result["download_filename"] = filename_root + ext
+                ext = _extension_for_mimetype(download_doc.mimetype)
+                if ext:
+                    result["download_filename"] = filename_root + ext
             except:
                 pass
             results.append(result)
 
-        if len(enabled_docs) > 1 and include_zip:
+        # A single document doesn't need a zip or a combined PDF
+        has_multiple_docs = len(enabled_docs) > 1
+
+        if include_zip and has_multiple_docs:
             bundled_zip = self.as_zip(
                 key=key, format="original" if original else "docx" if docx else "pdf"
             )
         else:
             bundled_zip = None
 
-        if len(enabled_docs) > 1 and include_full_pdf:
+        if include_full_pdf and has_multiple_docs:
             bundled_pdf = self.as_pdf(key=key, pdfa=pdfa)
         else:
             bundled_pdf = None
 
         return results, bundled_zip, bundled_pdf
 
+    def precompute_downloadables(
+        self, **kwargs
+    ) -> Tuple[List[Dict[str, DAFile]], Optional[DAFile], Optional[DAFile]]:
+        """
+        Assembles the files for `download_list_html()` ahead of time and saves them on the bundle,
+        so that a later call to `download_list_html(use_previously_cached_files=True)` only renders
+        the table. The same as what the `x.create_downloads` background action saves, but in the
+        current process, for example in a code block that runs before the download screen.
+
+        Args:
+            **kwargs: Keyword arguments to pass to `get_cacheable_documents()`
+
+        Returns:
+            Tuple[List[Dict[str, DAFile]], Optional[DAFile], Optional[DAFile]]: The saved result of `get_cacheable_documents()`.
+        """
+        self._downloadable_files = self.get_cacheable_documents(**kwargs)
+        return self._downloadable_files
+
     def download_list_html(
         self,
         key: str = "final",
@@ -1969,11 +3002,31 @@ class ALDocumentBundle(DAList):
         Returns:
             str: HTML representation of a table with documents and their associated actions.
         """
-        if not hasattr(self, "_cached_zip_label"):
-            self._cached_zip_label = str(self.zip_label)
-
-        if not hasattr(self, "_cached_full_pdf_label"):
-            self._cached_full_pdf_label = str(self.full_pdf_label)
+        # The same table is often shown more than once on a screen, and the files
+        # behind it don't change during a page load
+        cache_args = (
+            key,
+            format,
+            view,
+            refresh,
+            pdfa,
+            include_zip,
+            str(view_label),
+            view_icon,
+            str(download_label),
+            download_icon,
+            str(zip_label) if zip_label else None,
+            zip_icon,
+            append_matching_suffix,
+            include_email,
+            use_previously_cached_files,
+            include_full_pdf,
+            str(full_pdf_label) if full_pdf_label else None,
+        )
+        if not hasattr(self.cache, "_download_list_html"):
+            self.cache._download_list_html = {}
+        if cache_args in self.cache._download_list_html:
+            return self.cache._download_list_html[cache_args]
 
         if use_previously_cached_files and hasattr(self, "_downloadable_files"):
             downloadable_files, bundled_zip, bundled_pdf = self._downloadable_files
@@ -1990,7 +3043,26 @@ class ALDocumentBundle(DAList):
                 append_matching_suffix=append_matching_suffix,
             )
 
-        html = f'<div class="container al_table al_doc_table" id="{ html_safe_str(self.instanceName) }">'
+        parts = [
+            f'<div class="container al_table al_doc_table" id="{ self._safe_name() }">'
+        ]
+
+        # Every row uses the same buttons, so only render them once
+        download_button_template = _action_button_template(
+            label=download_label,
+            icon=download_icon,
+            color="primary",
+            size="md",
+            classname="al_download al_button",
+        )
+        if view:
+            view_button_template = _action_button_template(
+                label=view_label,
+                icon=view_icon,
+                color="secondary",
+                size="md",
+                classname="al_view al_button",
+            )
 
         for result in downloadable_files:
             title = result["title"]
@@ -2006,45 +3078,39 @@ class ALDocumentBundle(DAList):
                 continue  # Skip if the desired format is not available
 
             # Construct the download button
-            doc_download_button = action_button_html(
+            doc_download_button = _fill_button_template(
+                download_button_template,
                 download_doc.url_for(
                     attachment=True, display_filename=download_filename
                 ),
-                label=download_label,
-                icon=download_icon,
-                color="primary",
-                size="md",
-                classname="al_download al_button",
             )
 
             # Construct the view button if needed
             if view and "pdf" in result and result["pdf"].url_for().endswith(".pdf"):
                 # Use .pdf as the filename extension
                 view_filename = os.path.splitext(download_filename)[0] + ".pdf"
-                doc_view_button = action_button_html(
+                doc_view_button = _fill_button_template(
+                    view_button_template,
                     result["pdf"].url_for(
                         attachment=False, display_filename=view_filename
                     ),
-                    label=view_label,
-                    icon=view_icon,
-                    color="secondary",
-                    size="md",
-                    classname="al_view al_button",
                 )
                 buttons = [doc_view_button, doc_download_button]
             else:
                 buttons = [doc_download_button]
 
-            html += table_row(title, buttons)
+            parts.append(table_row(title, buttons))
 
         # Add a zip file row if included
         if include_zip and bundled_zip:
             if not zip_label:
-                zip_label = self._cached_zip_label
-            filename_root = os.path.splitext(str(self.filename))[0]
+                # Only rendered once per page load, and never saved with the interview
+                if not hasattr(self.cache, "zip_label_str"):
+                    self.cache.zip_label_str = str(self.zip_label)
+                zip_label = self.cache.zip_label_str
             zip_button = action_button_html(
                 bundled_zip.url_for(
-                    attachment=False, display_filename=filename_root + ".zip"
+                    attachment=False, display_filename=self._base_name() + ".zip"
                 ),
                 label=zip_label,
                 icon=zip_icon,
@@ -2052,15 +3118,16 @@ class ALDocumentBundle(DAList):
                 size="md",
                 classname="al_zip al_button",
             )
-            html += table_row(zip_label, zip_button)
+            parts.append(table_row(zip_label, zip_button))
 
         if include_full_pdf and bundled_pdf:
             if not full_pdf_label:
-                full_pdf_label = self._cached_full_pdf_label
-            filename_root = os.path.splitext(str(self.filename))[0]
+                if not hasattr(self.cache, "full_pdf_label_str"):
+                    self.cache.full_pdf_label_str = str(self.full_pdf_label)
+                full_pdf_label = self.cache.full_pdf_label_str
             full_pdf_button = action_button_html(
                 bundled_pdf.url_for(
-                    attachment=False, display_filename=filename_root + ".pdf"
+                    attachment=False, display_filename=self._base_name() + ".pdf"
                 ),
                 label=full_pdf_label,
                 icon="file-pdf",
@@ -2068,13 +3135,15 @@ class ALDocumentBundle(DAList):
                 size="md",
                 classname="al_full_pdf al_button",
             )
-            html += table_row(full_pdf_label, full_pdf_button)
+            parts.append(table_row(full_pdf_label, full_pdf_button))
 
         if include_email:
-            html += self.send_email_table_row(key=key)
+            parts.append(self.send_email_table_row(key=key))
 
-        html += "\n</div>"
+        parts.append("\n</div>")
 
+        html = "".join(parts)
+        self.cache._download_list_html[cache_args] = html
         return html
 
     def download_html(
@@ -2143,13 +3212,23 @@ class ALDocumentBundle(DAList):
             buttons = [doc_download_button]
 
         html = (
-            f'<div class="container al_table merged_docs" id="{html_safe_str(self.instanceName)}">'
+            f'<div class="container al_table merged_docs" id="{self._safe_name()}">'
             f"{table_row(self.title, buttons)}"
             f"\n</div>"
         )
 
         return html
 
+    @cached_property
+    def _cached_get_email_copy(self) -> str:
+        """The rendered `get_email_copy` template, used as the email header."""
+        return str(self.get_email_copy)
+
+    @cached_property
+    def _cached_include_editable_documents(self) -> str:
+        """The rendered `include_editable_documents` template."""
+        return str(self.include_editable_documents)
+
     def send_email_table_row(self, key: str = "final") -> str:
         """
         Generate HTML doc table row for an input box and button that allows
@@ -2163,43 +3242,39 @@ class ALDocumentBundle(DAList):
         """
         if not self.has_enabled_documents():
             return ""  # Don't let people email an empty set of documents
-        if not hasattr(self, "_cached_get_email_copy"):
-            self._cached_get_email_copy = str(self.get_email_copy)
-        if not hasattr(self, "_cached_include_editable_documents"):
-            self._cached_include_editable_documents = str(
-                self.include_editable_documents
-            )
-        name = html_safe_str(self.instanceName)
+        name = self._safe_name()
         al_wants_editable_input_id = "_ignore_al_wants_editable_" + name
         al_email_input_id = "_ignore_al_doc_email_" + name
         al_send_button_id = "al_send_email_button_" + name
 
         javascript_string = (
             f"javascript:aldocument_send_action("
-            f"'{self.attr_name('send_email_action_event')}',"
+            f"'{self._event_name('send_email_action_event')}',"
             f"'{al_wants_editable_input_id}','{al_email_input_id}')"
         )
 
         # Label "email" and input field for the 1st column of the table row
-        input_html = f"""
-        <span class="al_email_input_container {name} form-group da-field-container da-field-container-datatype-email">
-          <label for="{al_email_input_id}" class="col-form-label da-form-label datext-right">Email</label>
-          <input value="{user_info().email if user_logged_in() else ''}" alt="Email address for document" class="form-control al_doc_email_field al_button" type="email" size="35" name="{al_email_input_id}" id="{al_email_input_id}">
-        </span>
-        """
+        input_html = _SEND_ROW_EMAIL_INPUT_TEMPLATE.format(
+            name=name,
+            al_email_input_id=al_email_input_id,
+            email=user_info().email if user_logged_in() else "",
+        )
 
         # "Send" button for the 2nd column of the table row
-        send_button = f'{action_button_html(javascript_string, label="Send", icon="envelope", color="primary", size="md", classname="al_send_email_button al_button", id_tag=al_send_button_id)}'
+        send_button = action_button_html(
+            javascript_string,
+            label="Send",
+            icon="envelope",
+            color="primary",
+            size="md",
+            classname="al_send_email_button al_button",
+            id_tag=al_send_button_id,
+        )
 
         # Whole row put together
-        html = f"""
-        <div class="row al_doc_table_row al_send_bundle {name}" id="al_send_bundle_{name}" name="al_send_bundle_{name}">
-          <div class="col col-12 col-sm-9 al_email_input_col">{ input_html }</div>
-          <div class="col col-12 col-sm-3 al_email_send_col al_buttons">{ send_button }</div>
-        </div>
-        """
-
-        return html
+        return _SEND_ROW_TEMPLATE.format(
+            name=name, input_html=input_html, send_button=send_button
+        )
 
     def send_button_to_html(
         self,
@@ -2230,14 +3305,12 @@ class ALDocumentBundle(DAList):
         """
         if not self.has_enabled_documents():
             return ""  # Don't let people email an empty set of documents
-        if not hasattr(self, "_cached_get_email_copy"):
-            self._cached_get_email_copy = str(self.get_email_copy)
-        name = html_safe_str(self.instanceName)
+        name = self._safe_name()
         al_send_button_id = "al_send_email_to_button_" + name
 
         javascript_string = (
             f"javascript:aldocument_send_to_action("
-            f"'{self.attr_name('send_email_to_action_event')}',"
+            f"'{self._event_name('send_email_to_action_event')}',"
             f"'{editable}',"
             f"'{email}',"
             f"'{al_send_button_id}',"
@@ -2282,20 +3355,14 @@ class ALDocumentBundle(DAList):
         """
         if not self.has_enabled_documents():
             return ""  # Don't let people email an empty set of documents
-        if not hasattr(self, "_cached_get_email_copy"):
-            self._cached_get_email_copy = str(self.get_email_copy)
-        if not hasattr(self, "_cached_include_editable_documents"):
-            self._cached_include_editable_documents = str(
-                self.include_editable_documents
-            )
-        name = html_safe_str(self.instanceName)
+        name = self._safe_name()
         al_wants_editable_input_id = "_ignore_al_wants_editable_" + name
         al_email_input_id = "_ignore_al_doc_email_" + name
         al_send_button_id = "al_send_email_button_" + name
 
         javascript_string = (
             f"javascript:aldocument_send_action("
-            f"'{self.attr_name('send_email_action_event')}',"
+            f"'{self._event_name('send_email_action_event')}',"
             f"'{al_wants_editable_input_id}',"
             f"'{al_email_input_id}',"
             f"'{template_name}',"
@@ -2303,36 +3370,38 @@ class ALDocumentBundle(DAList):
         )
 
         # Container of whole email section with header
-        return_str = f"""
-  <fieldset class="al_send_bundle al_send_section_alone {name}" id="al_send_bundle_{name}" name="al_send_bundle_{name}">
-    <legend class="h4 al_doc_email_header">{self._cached_get_email_copy}</legend> 
-    """
+        parts = [
+            _SEND_FIELDSET_HEADER_TEMPLATE.format(
+                name=name, email_header=self._cached_get_email_copy
+            )
+        ]
         # "Editable" checkbox
         if show_editable_checkbox:
-            return_str += f"""
-    <div class="form-check-container">
-      <div class="form-check">
-        <input class="form-check-input" type="checkbox" class="al_wants_editable" id="{al_wants_editable_input_id}">
-        <label class="al_wants_editable form-check-label" for="{al_wants_editable_input_id}">{self._cached_include_editable_documents}
-        </label>
-      </div>
-    </div>
-  """
+            parts.append(
+                _SEND_EDITABLE_CHECKBOX_TEMPLATE.format(
+                    al_wants_editable_input_id=al_wants_editable_input_id,
+                    include_editable_label=self._cached_include_editable_documents,
+                )
+            )
         # Email input and send button
-        return_str += f"""
-  <div class="al_email_container">
-  
-    <span class="al_email_address {name} container form-group row da-field-container da-field-container-datatype-email">
-      <label for="{al_email_input_id}" class="col-form-label da-form-label datext-right">Email</label>
-      <input value="{user_info().email if user_logged_in() else ''}" alt="Email address for document" class="form-control" type="email" size="35" name="{al_email_input_id}" id="{al_email_input_id}">
-    </span>
-    
-    {action_button_html(javascript_string, label="Send", icon="envelope", color="primary", size="md", classname="al_send_email_button", id_tag=al_send_button_id)}
-
-  </div>
-  """
-        return_str += "</fieldset>"  # .al_send_section_alone container
-        return return_str
+        parts.append(
+            _SEND_EMAIL_INPUT_TEMPLATE.format(
+                name=name,
+                al_email_input_id=al_email_input_id,
+                email=user_info().email if user_logged_in() else "",
+                send_button=action_button_html(
+                    javascript_string,
+                    label="Send",
+                    icon="envelope",
+                    color="primary",
+                    size="md",
+                    classname="al_send_email_button",
+                    id_tag=al_send_button_id,
+                ),
+            )
+        )
+        parts.append("</fieldset>")  # .al_send_section_alone container
+        return "".join(parts)
 
     def send_email(
         self,
@@ -2367,11 +3436,7 @@ class ALDocumentBundle(DAList):
                 template=template,
                 # Add both DOCX and PDF versions, but if it's not possible to be a DOCX don't add the PDF
                 # twice
-                attachments=list(
-                    dict.fromkeys(
-                        self.as_editable_list(key=key) + self.as_pdf_list(key=key)
-                    )
-                ),
+                attachments=self._editable_and_pdf_list(key=key),
                 **kwargs,
             )
         else:
@@ -2382,6 +3447,28 @@ class ALDocumentBundle(DAList):
                 **kwargs,
             )
 
+    def _editable_and_pdf_list(self, key: str = "final") -> List[DAFile]:
+        """
+        Returns the editable version of each document followed by its PDF version,
+        leaving out any file that is already in the list (like a PDF that has no
+        editable version).
+
+        Args:
+            key (str): Identifier for the document version, default is "final".
+
+        Returns:
+            List[DAFile]: The editable files and PDFs, without duplicates.
+        """
+        # The editable files come from the flattened bundle, but a nested bundle
+        # only has one combined PDF, so the two can't share a single walk. Stream
+        # the editable files instead of building their list, and reuse the PDF list
+        # already cached for the page, before dict.fromkeys removes duplicates.
+        return list(
+            dict.fromkeys(
+                chain(self._iter_editable(key=key), self._enabled_pdfs(key=key))
+            )
+        )
+
     def _is_self_enabled(self, refresh=True) -> bool:
         """
         Check if the document is always enabled or if it's enabled in the cache.
@@ -2427,9 +3514,10 @@ class ALDocumentBundle(DAList):
         Returns:
             bool: True if all enabled documents are DOCX, otherwise False.
         """
-        if all(f._is_docx() for f in self.enabled_documents()):
-            return True
-        return False
+        # Reads the same cached list of enabled documents for the whole page load
+        if not hasattr(self.cache, "_all_docx"):
+            self.cache._all_docx = all(f._is_docx() for f in self.enabled_documents())
+        return self.cache._all_docx
 
     def as_docx(
         self,
@@ -2449,18 +3537,38 @@ class ALDocumentBundle(DAList):
             DAFile: A DAFile object containing the concatenated DOCX or PDF file.
         """
         if append_matching_suffix and key == self.suffix_to_append:
-            filename = f"{base_name(self.filename)}_{key}"
+            filename = f"{self._base_name()}_{key}"
         else:
-            filename = f"{base_name(self.filename)}"
+            filename = self._base_name()
         if self._is_docx():
+            # Only concatenate once per page load, as long as the same documents
+            # are enabled
+            fingerprint = (
+                key,
+                filename,
+                tuple(
+                    doc.instanceName for doc in self.enabled_documents(refresh=refresh)
+                ),
+            )
+            if hasattr(self.cache, "_docx") and self.cache._docx[0] == fingerprint:
+                return self.cache._docx[1]
             try:
-                the_file = docx_concatenate(
-                    self.as_docx_list(key=key, refresh=refresh),
-                    filename=filename + ".docx",
-                )
+                docx_list = self.as_docx_list(key=key, refresh=refresh)
+                if len(docx_list) == 1 and _is_docx_file(docx_list[0]):
+                    # Nothing to combine, so copy the file instead of having
+                    # docx_concatenate re-save it through python-docx. A document
+                    # that only has a PDF goes through docx_concatenate, which
+                    # fails and falls back to as_pdf below
+                    the_file = DAFile()
+                    the_file.set_random_instance_name()
+                    the_file.initialize(filename=filename + ".docx", extension="docx")
+                    the_file.copy_into(docx_list[0])
+                else:
+                    the_file = docx_concatenate(docx_list, filename=filename + ".docx")
                 the_file.title = self.title
+                self.cache._docx = (fingerprint, the_file)
                 return the_file
-            except:
+            except Exception:
                 return self.as_pdf(
                     key=key,
                     refresh=refresh,
@@ -2496,15 +3604,15 @@ class ALExhibit(DAObject):
         starting_page (int): first page number to use in table of contents
     """
 
+    # Defaults for attributes that aren't set with .using() or in the interview
+    start_page = 1
+    # When the key is "preview", append it to the file name
+    suffix_to_append = "preview"
+
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
         self.initializeAttribute("_cache", DALazyAttribute)
         self.object_type = DAFileList
-        if not hasattr(self, "starting_page"):
-            self.start_page = 1
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
 
     def _start_ocr(self):
         """
@@ -2516,7 +3624,7 @@ class ALExhibit(DAObject):
         if len(self.pages):
             self.ocr_version = DAFile(self.attr_name("ocr_version"))
             self.ocr_version.initialize(filename="tmp_ocrd.pdf")
-            if get_config("assembly line", {}).get("ocr engine") == "ocrmypdf":
+            if _config("assembly line", {}).get("ocr engine") == "ocrmypdf":
                 self.ocr_status = background_action(
                     "al_exhibit_ocr_pages",
                     to_pdf=self.ocr_version,
@@ -2561,10 +3669,7 @@ class ALExhibit(DAObject):
             and self.ocr_version.ok
         ):
             return [self.ocr_version]
-        pages = []
-        for page in self.pages:
-            pages.append(page)
-        return pages
+        return list(self.pages)
 
     def as_pdf(
         self,
@@ -2600,10 +3705,22 @@ class ALExhibit(DAObject):
         if add_page_numbers:
             safe_key = safe_key + "_page_nums"
 
-        if hasattr(self._cache, safe_key):
-            return getattr(self._cache, safe_key)
         if not filename:
             filename = "exhibits.pdf"
+
+        # The numbering and contents depend on more than the options in safe_key;
+        # only reuse the cached file if none of them changed during the page load
+        fingerprint = (
+            len(self.pages),
+            self.start_page,
+            prefix,
+            add_cover_page,
+            filename,
+        )
+        if hasattr(self._cache, safe_key):
+            cached_fingerprint, cached_file = getattr(self._cache, safe_key)
+            if cached_fingerprint == fingerprint:
+                return cached_file
         if add_cover_page:
             concatenated_pages = pdf_concatenate(
                 self.cover_page, self.ocr_pages(), filename=filename, pdfa=pdfa
@@ -2616,8 +3733,8 @@ class ALExhibit(DAObject):
         if add_page_numbers:
             concatenated_pages.bates_number(prefix=prefix, start=self.start_page)
 
-        setattr(self._cache, safe_key, concatenated_pages)
-        return getattr(self._cache, safe_key)
+        setattr(self._cache, safe_key, (fingerprint, concatenated_pages))
+        return concatenated_pages
 
     def num_pages(self) -> int:
         """
@@ -2626,7 +3743,15 @@ class ALExhibit(DAObject):
         Returns:
             int: Total page count.
         """
-        return self.pages.num_pages()
+        # Counting pages opens every file; only do it again if the files changed
+        signature = tuple(getattr(page, "number", id(page)) for page in self.pages)
+        if (
+            hasattr(self._cache, "_num_pages")
+            and self._cache._num_pages[0] == signature
+        ):
+            return self._cache._num_pages[1]
+        self._cache._num_pages = (signature, self.pages.num_pages())
+        return self._cache._num_pages[1]
 
     @property
     def complete(self) -> bool:
@@ -2685,22 +3810,31 @@ def ocrmypdf_task(
     else:
         ocr_params = ["ocrmypdf", "--skip-text", from_file.path(), to_pdf.path()]
 
-    completed_ocr = None
-    try:
-        completed_ocr = subprocess.run(
-            ocr_params, timeout=60 * 60, check=False, capture_output=True
-        )
-        to_pdf.commit()
-        result = completed_ocr.returncode
-    except subprocess.TimeoutExpired:
-        result = 1
-        log("ocr with ocrmypdf took too long (over an hour)")
-    if result != 0:
-        ocr_error_msg = f": {completed_ocr.stderr.decode()}" if completed_ocr else ""
-        log("failed to ocr with ocrmypdf" + ocr_error_msg)
-        return None
-    else:
-        return to_pdf.path()
+    # ocrmypdf can log a lot over a long run: send it to a file instead of memory,
+    # and only read back the end of it if something goes wrong
+    with tempfile.TemporaryFile() as ocr_stderr:
+        completed_ocr = None
+        try:
+            completed_ocr = subprocess.run(
+                ocr_params,
+                timeout=60 * 60,
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=ocr_stderr,
+            )
+            to_pdf.commit()
+            result = completed_ocr.returncode
+        except subprocess.TimeoutExpired:
+            result = 1
+            log("ocr with ocrmypdf took too long (over an hour)")
+        if result != 0:
+            ocr_error_msg = ""
+            if completed_ocr:
+                ocr_stderr.seek(max(0, ocr_stderr.seek(0, os.SEEK_END) - 4096))
+                ocr_error_msg = f": {ocr_stderr.read().decode(errors='replace')}"
+            log("failed to ocr with ocrmypdf" + ocr_error_msg)
+            return None
+    return to_pdf.path()
 
 
 class ALExhibitList(DAList):
@@ -2716,25 +3850,20 @@ class ALExhibitList(DAList):
         auto_ocr (bool): If True, automatically starts OCR processing for uploaded exhibits. Defaults to True.
     """
 
+    # Defaults for attributes that aren't set with .using() or in the interview
+    auto_label = True
+    auto_labeler = staticmethod(alpha)
+    auto_ocr = False
+    include_table_of_contents = True
+    include_exhibit_cover_pages = True
+    bates_prefix = ""
+    # When the key is "preview", append it to the file name
+    suffix_to_append = "preview"
+
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
-        if not hasattr(self, "auto_label"):
-            self.auto_label = True
-        if not hasattr(self, "auto_labeler"):
-            self.auto_labeler = alpha
-        if not hasattr(self, "auto_ocr"):
-            self.auto_ocr = False
-        if not hasattr(self, "include_table_of_contents"):
-            self.include_table_of_contents = True
-        if not hasattr(self, "include_exhibit_cover_pages"):
-            self.include_exhibit_cover_pages = True
-        if not hasattr(self, "bates_prefix"):
-            self.bates_prefix = ""
         self.object_type = ALExhibit
         self.complete_attribute = "complete"
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
 
     def as_pdf(
         self,
@@ -2757,23 +3886,58 @@ class ALExhibitList(DAList):
         Returns:
             DAFile: A single PDF containing all exhibits.
         """
-        if self.include_exhibit_cover_pages:
+        include_cover_pages = self.include_exhibit_cover_pages
+        prefix = self.bates_prefix
+        if include_cover_pages:
             for exhibit in self:
                 exhibit.cover_page
         if self.include_table_of_contents and toc_pages != 1:
             self._update_page_numbers(toc_guess_pages=toc_pages)
-        return pdf_concatenate(
-            [
-                exhibit.as_pdf(
-                    add_cover_page=self.include_exhibit_cover_pages,
-                    add_page_numbers=add_page_numbers,
-                    prefix=self.bates_prefix,
-                )
-                for exhibit in self
-            ],
-            filename=filename,
-            pdfa=pdfa,
-        )
+        if add_page_numbers and not self._has_contiguous_page_numbers():
+            # Number each exhibit on its own, starting from its own start_page.
+            # Not done in a thread pool: the interview state docassemble needs to
+            # assemble cover pages is thread-local.
+            return pdf_concatenate(
+                [
+                    exhibit.as_pdf(
+                        add_cover_page=include_cover_pages,
+                        add_page_numbers=add_page_numbers,
+                        prefix=prefix,
+                    )
+                    for exhibit in self
+                ],
+                filename=filename,
+                pdfa=pdfa,
+            )
+        # Concatenate every cover page and page at once, so each page is only
+        # written once, then number the whole thing in a single pass
+        files = []
+        for exhibit in self:
+            if include_cover_pages:
+                files.append(exhibit.cover_page)
+            files.extend(exhibit.ocr_pages())
+        combined = pdf_concatenate(files, filename=filename)
+        if add_page_numbers and len(self.elements):
+            combined.bates_number(prefix=prefix, start=self.elements[0].start_page)
+        if pdfa:
+            pdf_to_pdfa(combined.path())
+        return combined
+
+    def _has_contiguous_page_numbers(self) -> bool:
+        """
+        Checks that each exhibit starts on the page right after the previous exhibit ends,
+        so the whole list can be numbered in one pass.
+
+        Returns:
+            bool: True if the exhibits' start pages follow each other without gaps or overlaps.
+        """
+        cover_pages = 1 if self.include_exhibit_cover_pages else 0
+        next_page = None
+        for exhibit in self.elements:
+            if next_page is not None and exhibit.start_page != next_page:
+                return False
+            next_page = exhibit.start_page + exhibit.num_pages() + cover_pages
+        return True
 
     def size_in_bytes(self) -> int:
         """
@@ -2782,10 +3946,11 @@ class ALExhibitList(DAList):
         Returns:
             int: Total size of all exhibits in bytes.
         """
-        full_size = 0
-        for exhibit in self.complete_elements():
-            full_size += sum((a_page.size_in_bytes() for a_page in exhibit.pages))
-        return full_size
+        return sum(
+            a_page.size_in_bytes()
+            for exhibit in self.complete_elements()
+            for a_page in exhibit.pages
+        )
 
     def _update_labels(self, auto_labeler: Optional[Callable] = None) -> None:
         """
@@ -2808,10 +3973,8 @@ class ALExhibitList(DAList):
         Returns:
             bool: True if all exhibits are OCRed or if OCR hasn't started. False otherwise.
         """
-        ready = True
-        for exhibit in self.elements:
-            ready &= exhibit.ocr_ready()
-        return ready
+        # Stop at the first exhibit that is still being processed
+        return all(exhibit.ocr_ready() for exhibit in self.elements)
 
     def _update_page_numbers(
         self, starting_number: Optional[int] = None, toc_guess_pages: int = 1
@@ -2825,16 +3988,21 @@ class ALExhibitList(DAList):
         """
         toc_pages = toc_guess_pages if self.include_table_of_contents else 0
         cover_pages = 1 if self.include_exhibit_cover_pages else 0
-        current_index = starting_number if starting_number else 1
-        current_index += toc_pages
-        for exhibit in self.elements:
-            exhibit.start_page = current_index
-            current_index = current_index + exhibit.num_pages() + cover_pages
+        first_page = (starting_number if starting_number else 1) + toc_pages
+        # Each exhibit starts after the pages (and cover pages) of the ones before it
+        start_pages = accumulate(
+            (exhibit.num_pages() + cover_pages for exhibit in self.elements[:-1]),
+            initial=first_page,
+        )
+        for exhibit, start_page in zip(self.elements, start_pages):
+            exhibit.start_page = start_page
 
     def _start_ocr(self) -> None:
         """
         Initiates the OCR process for each exhibit in the list.
         """
+        # Each call only queues a background task, so there's nothing to overlap by
+        # running them in threads; the OCR itself already runs in the background
         for exhibit in self.elements:
             exhibit._start_ocr()
 
@@ -2894,33 +4062,26 @@ class ALExhibitDocument(ALDocument):
     ```
     """
 
+    # Defaults for attributes that aren't set with .using() or in the interview
+    include_exhibit_cover_pages = True
+    include_table_of_contents = True
+    add_page_numbers = False
+
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
         self.initializeAttribute("exhibits", ALExhibitList)
+        # Only pass these on if they were set, so the list keeps its own defaults
         if hasattr(self, "auto_labeler"):
             self.exhibits.auto_labeler = self.auto_labeler
         if hasattr(self, "auto_ocr"):
             self.exhibits.auto_ocr = self.auto_ocr
         if hasattr(self, "bates_prefix"):
             self.exhibits.bates_prefix = self.bates_prefix
-        if hasattr(self, "include_exhibit_cover_pages"):
-            self.exhibits.include_exhibit_cover_pages = self.include_exhibit_cover_pages
-        else:
-            self.include_exhibit_cover_pages = True
-            self.exhibits.include_exhibit_cover_pages = True
         if hasattr(self, "maximum_size"):
             self.exhibits.maximum_size = self.maximum_size
-        if hasattr(self, "include_table_of_contents"):
-            self.exhibits.include_table_of_contents = self.include_table_of_contents
-        else:
-            self.include_table_of_contents = True
-            self.exhibits.include_table_of_contents = True
-        if not hasattr(self, "add_page_numbers"):
-            self.add_page_numbers = False
+        self.exhibits.include_exhibit_cover_pages = self.include_exhibit_cover_pages
+        self.exhibits.include_table_of_contents = self.include_table_of_contents
         self.has_addendum = False
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
 
     def has_overflow(self) -> bool:
         """
@@ -2988,30 +4149,81 @@ class ALExhibitDocument(ALDocument):
         Returns:
             DAFile: The document rendered as a PDF.
         """
-        if not hasattr(self, "suffix_to_append"):
-            self.suffix_to_append = "preview"
         if append_matching_suffix and key == self.suffix_to_append:
-            filename = f"{base_name(self.filename)}_{key}.pdf"
+            filename = f"{self._base_name()}_{key}.pdf"
         else:
-            filename = base_name(self.filename) + ".pdf"
+            filename = self._base_name() + ".pdf"
 
         if len(self.exhibits):
+            # Only assemble the exhibits once per page load, as long as the same
+            # exhibits and pages are there
+            exhibits_signature = tuple(
+                (exhibit.instanceName, len(exhibit.pages)) for exhibit in self.exhibits
+            )
+            fingerprint = (
+                filename,
+                pdfa,
+                self.include_table_of_contents,
+                self.add_page_numbers,
+                exhibits_signature,
+            )
+            if (
+                hasattr(self.cache, "_exhibits_pdf")
+                and self.cache._exhibits_pdf[0] == fingerprint
+            ):
+                return self.cache._exhibits_pdf[1]
             if self.include_table_of_contents:
-                toc_pages = self.table_of_contents.num_pages()
-                return pdf_concatenate(
-                    self.table_of_contents,
-                    self.exhibits.as_pdf(
-                        add_page_numbers=self.add_page_numbers, toc_pages=toc_pages
-                    ),
-                    filename=filename,
-                    pdfa=pdfa,
+                toc_pages = self._toc_num_pages(exhibits_signature)
+                # ALExhibitList.as_pdf() already joins all of the exhibits in one
+                # pass, and can't fan out to threads (see the note there)
+                exhibits_pdf = self.exhibits.as_pdf(
+                    add_page_numbers=self.add_page_numbers, toc_pages=toc_pages
                 )
+                toc_pdf = self.table_of_contents
+                if hasattr(toc_pdf, "pdf"):
+                    # The table of contents is assembled from a DOCX template
+                    toc_pdf = toc_pdf.pdf
+                # PDF/A output still needs pdf_concatenate's conversion step
+                the_file = (
+                    None
+                    if pdfa
+                    else _fast_concatenate([toc_pdf, exhibits_pdf], filename)
+                )
+                if the_file is None:
+                    the_file = pdf_concatenate(
+                        self.table_of_contents,
+                        exhibits_pdf,
+                        filename=filename,
+                        pdfa=pdfa,
+                    )
             else:
-                return self.exhibits.as_pdf(
+                the_file = self.exhibits.as_pdf(
                     add_page_numbers=self.add_page_numbers,
                     filename=filename,
                     pdfa=pdfa,
                 )
+            self.cache._exhibits_pdf = (fingerprint, the_file)
+            return the_file
+
+    def _toc_num_pages(self, exhibits_signature: tuple) -> int:
+        """
+        Count the pages in the table of contents, once per page load for the same
+        exhibits, so that the preview and final PDFs don't each reopen it.
+
+        Args:
+            exhibits_signature (tuple): The instanceName and page count of each exhibit.
+
+        Returns:
+            int: The number of pages in the table of contents.
+        """
+        if (
+            hasattr(self.cache, "_toc_pages")
+            and self.cache._toc_pages[0] == exhibits_signature
+        ):
+            return self.cache._toc_pages[1]
+        toc_pages = self.table_of_contents.num_pages()
+        self.cache._toc_pages = (exhibits_signature, toc_pages)
+        return toc_pages
 
     def as_docx(
         self,
@@ -3048,9 +4260,6 @@ class ALTableDocument(ALDocument):
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
         self.has_addendum = False
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
 
     def has_overflow(self) -> bool:
         """
@@ -3090,7 +4299,7 @@ class ALTableDocument(ALDocument):
         Returns:
             List[DAFile]: A list containing the document.
         """
-        return [self[key]]
+        return [self.as_pdf(key=key, refresh=refresh)]
 
     def as_pdf(
         self,
@@ -3104,6 +4313,10 @@ class ALTableDocument(ALDocument):
         Despite the name, returns the document as an Excel Spreadsheet (XLSX file).
         Name retained for signature compatibility.
 
+        Exporting the table is the slow step, so it is only done the first time
+        this is called and the spreadsheet is kept in `file`. Every key returns the
+        same spreadsheet.
+
         Args:
             key (str): Identifier key for the document, mainly for compatibility with ALDocument.
             refresh (bool): For signature compatibility
@@ -3113,13 +4326,10 @@ class ALTableDocument(ALDocument):
         Returns:
             DAFile: The table rendered as an XLSX spreadsheet
         """
-        if not hasattr(self, "suffix_to_append"):
-            # When the key is "preview", append it to the file name
-            self.suffix_to_append = "preview"
         if hasattr(self, "file"):
             return self.file
         self.file: DAFile = self.table.export(
-            base_name(self.filename) + ".xlsx", title=self.filename
+            self._base_name() + ".xlsx", title=self.filename
         )
         return self.file
 
@@ -3159,8 +4369,6 @@ class ALUntransformedDocument(ALDocument):
     def init(self, *pargs, **kwargs):
         super().init(*pargs, **kwargs)
         self.has_addendum = False
-        if not hasattr(self, "suffix_to_append"):
-            self.suffix_to_append = "preview"
 
     def has_overflow(self) -> bool:
         """
@@ -3244,9 +4452,12 @@ class ALDocumentUpload(ALUntransformedDocument):
         # This overrides the .get() method so that the 'final' and 'private' key always exist and
         # point to the same file.
         # There's no need to have final/preview versions of an uploaded document
-        if isinstance(self.file, DAFileList):
-            self.file = unpack_dafilelist(self.file)
-        return self.file
+        # The isinstance check is kept on every call instead of a "normalized"
+        # flag, since a new upload can replace the file with a new DAFileList
+        the_file = self.file
+        if isinstance(the_file, DAFileList):
+            self.file = the_file = unpack_dafilelist(the_file)
+        return the_file
 
 
 def unpack_dafilelist(the_file: DAFileList) -> DAFile:
@@ -3259,7 +4470,7 @@ def unpack_dafilelist(the_file: DAFileList) -> DAFile:
     """
     if isinstance(the_file, DAFileList):
         temp_name = the_file.instanceName
-        inner_file = next(iter(the_file))
+        inner_file = the_file[0]
         inner_file.instanceName = temp_name  # reset instance name to the whole object instead of index in list we got rid of
         return inner_file
     else:
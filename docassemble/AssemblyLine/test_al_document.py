@@ -1,6 +1,53 @@
+import os
+import pickle
+import tempfile
+import textwrap
 import unittest
+import zipfile
+from unittest.mock import MagicMock, patch
+
+import pikepdf
 from docassemble.base.util import DAFile
-from .al_document import ALDocument, ALDocumentBundle, ALAddendumField
+from . import al_document
+from .al_document import (
+    ALDocument,
+    ALDocumentBundle,
+    ALExhibitList,
+    ALAddendumField,
+    DALazyAttribute,
+    ensure_pdf_page_parity,
+    html_safe_str,
+    pdf_page_parity,
+    _concatenate_pdf_paths,
+    _first_wrapped_line,
+    _is_docx_file,
+    _write_zip,
+)
+
+
+def _make_pdf(path, pages=1, field_name=None, page_size=(612, 792), bookmark=None):
+    """Save a blank PDF, optionally with a field or a bookmark on the first page."""
+    with pikepdf.new() as pdf:
+        for _ in range(pages):
+            pdf.add_blank_page(page_size=page_size)
+        if field_name:
+            field = pdf.make_indirect(
+                pikepdf.Dictionary(
+                    Type=pikepdf.Name.Annot,
+                    Subtype=pikepdf.Name.Widget,
+                    FT=pikepdf.Name.Tx,
+                    T=pikepdf.String(field_name),
+                    Rect=pikepdf.Array([72, 700, 300, 720]),
+                )
+            )
+            pdf.pages[0].obj.Annots = pikepdf.Array([field])
+            pdf.Root.AcroForm = pikepdf.Dictionary(
+                Fields=pikepdf.Array([field]), NeedAppearances=True
+            )
+        if bookmark:
+            with pdf.open_outline() as outline:
+                outline.root.append(pikepdf.OutlineItem(bookmark, 0))
+        pdf.save(path)
 
 
 class test_dont_assume_pdf(unittest.TestCase):
@@ -120,5 +167,334 @@ class TestOriginalOrOverflowMessage(unittest.TestCase):
         )  # Original value exceeds the overflow_trigger, but preserve_newlines is True
 
 
+class TestHtmlSafeStr(unittest.TestCase):
+    def test_alphanumeric_unchanged(self):
+        self.assertEqual(html_safe_str("bundle1"), "bundle1")
+
+    def test_runs_replaced_with_single_underscore(self):
+        self.assertEqual(html_safe_str("al_user_bundle"), "al_user_bundle")
+        self.assertEqual(html_safe_str("docs['final'].x"), "docs_final_x")
+        self.assertEqual(html_safe_str("a__b  c"), "a_b_c")
+
+    def test_non_ascii_replaced(self):
+        self.assertEqual(html_safe_str("résumé"), "r_sum_")
+        self.assertEqual(html_safe_str("x²"), "x_")
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestFirstWrappedLine(unittest.TestCase):
+    def assertMatchesTextwrap(self, value, width):
+        expected = (textwrap.wrap(value, width) or [""])[0].rstrip()
+        self.assertEqual(_first_wrapped_line(value, width), expected)
+
+    def test_cuts_at_last_space(self):
+        self.assertEqual(_first_wrapped_line("one two three four", 9), "one two")
+        self.assertMatchesTextwrap("one two three four", 9)
+
+    def test_value_that_fits_is_not_cut(self):
+        self.assertEqual(_first_wrapped_line("one two", 20), "one two")
+        self.assertEqual(_first_wrapped_line("one two ", 8), "one two")
+        self.assertEqual(_first_wrapped_line("", 5), "")
+
+    def test_matches_textwrap(self):
+        for value in [
+            "a well-known phrase that wraps",
+            " leading space before words",
+            "averyveryverylongword and more",
+            "short words in a sentence here",
+        ]:
+            for width in range(1, len(value) + 2):
+                with self.subTest(value=value, width=width):
+                    self.assertMatchesTextwrap(value, width)
+
+
+class TestDALazyAttributeState(unittest.TestCase):
+    def test_only_instance_name_is_pickled(self):
+        cache = DALazyAttribute("the_cache")
+        cache.rendered = "expensive value"
+        self.assertEqual(cache.__getstate__(), ("the_cache",))
+
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(restored.instanceName, "the_cache")
+        self.assertNotIn("rendered", restored.__dict__)
+
+    def test_without_instance_name(self):
+        cache = DALazyAttribute()
+        cache.__dict__.pop("instanceName", None)
+        self.assertEqual(cache.__getstate__(), ())
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertNotIn("instanceName", restored.__dict__)
+
+    def test_legacy_dict_state(self):
+        # Interviews saved before the state became a tuple stored a dictionary
+        restored = DALazyAttribute.__new__(DALazyAttribute)
+        restored.__setstate__({"instanceName": "legacy_cache"})
+        self.assertEqual(restored.instanceName, "legacy_cache")
+
+        empty = DALazyAttribute.__new__(DALazyAttribute)
+        empty.__setstate__({})
+        self.assertNotIn("instanceName", empty.__dict__)
+
+
+class TestConcatenatePdfPaths(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_copies_pages_in_order(self):
+        _make_pdf(self.path("a.pdf"), pages=2)
+        _make_pdf(self.path("b.pdf"), pages=3)
+        self.assertTrue(
+            _concatenate_pdf_paths(
+                [self.path("a.pdf"), self.path("b.pdf")], self.path("out.pdf")
+            )
+        )
+        with pikepdf.open(self.path("out.pdf")) as pdf:
+            self.assertEqual(len(pdf.pages), 5)
+
+    def test_form_fields_are_left_for_pdf_concatenate(self):
+        # Copying pages would drop /AcroForm, so form PDFs must not be merged here
+        _make_pdf(self.path("form_a.pdf"), field_name="first_name")
+        _make_pdf(self.path("form_b.pdf"), field_name="last_name")
+        self.assertFalse(
+            _concatenate_pdf_paths(
+                [self.path("form_a.pdf"), self.path("form_b.pdf")],
+                self.path("out.pdf"),
+            )
+        )
+        self.assertFalse(os.path.exists(self.path("out.pdf")))
+        # Even one form among plain PDFs keeps the fields out of the fast path
+        _make_pdf(self.path("plain.pdf"))
+        self.assertFalse(
+            _concatenate_pdf_paths(
+                [self.path("plain.pdf"), self.path("form_b.pdf")],
+                self.path("out.pdf"),
+            )
+        )
+
+    def test_bookmarks_are_left_for_pdf_concatenate(self):
+        # A table of contents followed by exhibits with bookmarks
+        _make_pdf(self.path("toc.pdf"))
+        _make_pdf(self.path("exhibits.pdf"), pages=2, bookmark="Exhibit A")
+        self.assertFalse(
+            _concatenate_pdf_paths(
+                [self.path("toc.pdf"), self.path("exhibits.pdf")],
+                self.path("out.pdf"),
+            )
+        )
+        self.assertFalse(os.path.exists(self.path("out.pdf")))
+
+
+class TestWriteZip(unittest.TestCase):
+    def test_compressed_formats_are_stored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            entries = []
+            for name, content in [
+                ("form.pdf", b"%PDF-1.4 " * 100),
+                ("letter.DOCX", b"PK docx " * 100),
+                ("notes.txt", b"plain text " * 100),
+            ]:
+                path = os.path.join(tmp, "source_" + name)
+                with open(path, "wb") as f:
+                    f.write(content)
+                entries.append((name, path))
+            zip_path = os.path.join(tmp, "bundle.zip")
+
+            _write_zip(entries, zip_path)
+
+            with zipfile.ZipFile(zip_path) as zf:
+                self.assertEqual(
+                    zf.namelist(), ["form.pdf", "letter.DOCX", "notes.txt"]
+                )
+                compress_types = {
+                    info.filename: info.compress_type for info in zf.infolist()
+                }
+                self.assertEqual(compress_types["form.pdf"], zipfile.ZIP_STORED)
+                self.assertEqual(compress_types["letter.DOCX"], zipfile.ZIP_STORED)
+                self.assertEqual(compress_types["notes.txt"], zipfile.ZIP_DEFLATED)
+                self.assertIsNone(zf.testzip())
+                for name, path in entries:
+                    with open(path, "rb") as f:
+                        self.assertEqual(zf.read(name), f.read())
+
+
+class TestPdfPageParity(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def page_count(self, path):
+        with pikepdf.open(path) as pdf:
+            return len(pdf.pages)
+
+    def test_pdf_page_parity(self):
+        for pages, parity in [(1, "odd"), (2, "even"), (3, "odd"), (4, "even")]:
+            with self.subTest(pages=pages):
+                _make_pdf(self.path("doc.pdf"), pages=pages)
+                self.assertEqual(pdf_page_parity(self.path("doc.pdf")), parity)
+
+    def test_ensure_pdf_page_parity(self):
+        for pages in range(1, 5):
+            for parity in ("even", "odd"):
+                with self.subTest(pages=pages, parity=parity):
+                    _make_pdf(self.path("doc.pdf"), pages=pages)
+                    needs_page = (pages % 2 == 0) != (parity == "even")
+                    self.assertEqual(
+                        ensure_pdf_page_parity(self.path("doc.pdf"), parity),
+                        needs_page,
+                    )
+                    self.assertEqual(
+                        self.page_count(self.path("doc.pdf")),
+                        pages + 1 if needs_page else pages,
+                    )
+
+    def test_blank_page_matches_last_page_size(self):
+        _make_pdf(self.path("doc.pdf"), pages=1, page_size=(300, 400))
+        self.assertTrue(ensure_pdf_page_parity(self.path("doc.pdf"), "even"))
+        with pikepdf.open(self.path("doc.pdf")) as pdf:
+            media_box = [float(value) for value in pdf.pages[-1].mediabox]
+        self.assertEqual(media_box, [0, 0, 300, 400])
+
+    def test_concatenate_pads_to_parity(self):
+        _make_pdf(self.path("a.pdf"), pages=2)
+        _make_pdf(self.path("b.pdf"), pages=1)
+        paths = [self.path("a.pdf"), self.path("b.pdf")]
+        for parity, expected_pages in [(None, 3), ("odd", 3), ("even", 4)]:
+            with self.subTest(parity=parity):
+                self.assertTrue(
+                    _concatenate_pdf_paths(paths, self.path("out.pdf"), parity)
+                )
+                self.assertEqual(self.page_count(self.path("out.pdf")), expected_pages)
+
+
+class TestIsDocxFile(unittest.TestCase):
+    def test_extension_or_mimetype(self):
+        self.assertTrue(_is_docx_file(MagicMock(extension="DOCX", mimetype=None)))
+        self.assertTrue(
+            _is_docx_file(
+                MagicMock(
+                    extension=None,
+                    mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                )
+            )
+        )
+        self.assertFalse(
+            _is_docx_file(MagicMock(extension="pdf", mimetype="application/pdf"))
+        )
+        self.assertFalse(_is_docx_file(object()))
+
+
+def _mock_exhibit(name, start_page, num_pages):
+    exhibit = MagicMock(name=name)
+    exhibit.start_page = start_page
+    exhibit.num_pages.return_value = num_pages
+    exhibit.cover_page = f"{name}_cover"
+    exhibit.ocr_pages.return_value = [f"{name}_page_{n}" for n in range(num_pages)]
+    return exhibit
+
+
+class TestALExhibitListAsPdf(unittest.TestCase):
+    def make_list(self, *exhibits, **kwargs):
+        kwargs.setdefault("include_exhibit_cover_pages", True)
+        kwargs.setdefault("include_table_of_contents", False)
+        return ALExhibitList(
+            "exhibits", elements=list(exhibits), bates_prefix="EX-", **kwargs
+        )
+
+    def setUp(self):
+        patcher = patch.object(al_document, "pdf_concatenate")
+        self.pdf_concatenate = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(al_document, "pdf_to_pdfa")
+        self.pdf_to_pdfa = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_contiguous_page_numbers(self):
+        # Each exhibit starts after the previous one's cover page and pages
+        exhibits = self.make_list(
+            _mock_exhibit("a", 1, 1), _mock_exhibit("b", 3, 2), _mock_exhibit("c", 6, 1)
+        )
+        self.assertTrue(exhibits._has_contiguous_page_numbers())
+        exhibits.elements[1].start_page = 4
+        self.assertFalse(exhibits._has_contiguous_page_numbers())
+
+        without_covers = self.make_list(
+            _mock_exhibit("a", 1, 1),
+            _mock_exhibit("b", 2, 2),
+            include_exhibit_cover_pages=False,
+        )
+        self.assertTrue(without_covers._has_contiguous_page_numbers())
+
+    def test_update_page_numbers(self):
+        exhibits = self.make_list(
+            _mock_exhibit("a", 0, 1),
+            _mock_exhibit("b", 0, 2),
+            _mock_exhibit("c", 0, 1),
+            include_table_of_contents=True,
+        )
+        exhibits._update_page_numbers(toc_guess_pages=2)
+        self.assertEqual(
+            [exhibit.start_page for exhibit in exhibits.elements], [3, 5, 8]
+        )
+        self.assertTrue(exhibits._has_contiguous_page_numbers())
+
+    def test_one_concatenation_and_one_numbering_pass(self):
+        exhibit_a = _mock_exhibit("a", 1, 1)
+        exhibit_b = _mock_exhibit("b", 3, 2)
+        exhibits = self.make_list(exhibit_a, exhibit_b)
+
+        result = exhibits.as_pdf(filename="exhibits.pdf", add_page_numbers=True)
+
+        combined = self.pdf_concatenate.return_value
+        self.assertIs(result, combined)
+        self.pdf_concatenate.assert_called_once_with(
+            ["a_cover", "a_page_0", "b_cover", "b_page_0", "b_page_1"],
+            filename="exhibits.pdf",
+        )
+        combined.bates_number.assert_called_once_with(prefix="EX-", start=1)
+        exhibit_a.as_pdf.assert_not_called()
+        exhibit_b.as_pdf.assert_not_called()
+        self.pdf_to_pdfa.assert_not_called()
+
+    def test_without_cover_pages_or_numbers(self):
+        exhibits = self.make_list(
+            _mock_exhibit("a", 1, 1),
+            _mock_exhibit("b", 2, 1),
+            include_exhibit_cover_pages=False,
+        )
+
+        exhibits.as_pdf(filename="exhibits.pdf", pdfa=True)
+
+        combined = self.pdf_concatenate.return_value
+        self.pdf_concatenate.assert_called_once_with(
+            ["a_page_0", "b_page_0"], filename="exhibits.pdf"
+        )
+        combined.bates_number.assert_not_called()
+        self.pdf_to_pdfa.assert_called_once_with(combined.path.return_value)
+
+    def test_gaps_in_page_numbers_number_each_exhibit(self):
+        exhibit_a = _mock_exhibit("a", 1, 1)
+        exhibit_b = _mock_exhibit("b", 10, 2)
+        exhibits = self.make_list(exhibit_a, exhibit_b)
+
+        exhibits.as_pdf(filename="exhibits.pdf", add_page_numbers=True)
+
+        for exhibit in (exhibit_a, exhibit_b):
+            exhibit.as_pdf.assert_called_once_with(
+                add_cover_page=True, add_page_numbers=True, prefix="EX-"
+            )
+        self.pdf_concatenate.assert_called_once_with(
+            [exhibit_a.as_pdf.return_value, exhibit_b.as_pdf.return_value],
+            filename="exhibits.pdf",
+            pdfa=False,
+        )
+        self.pdf_concatenate.return_value.bates_number.assert_not_called()